@@ -1,11 +1,12 @@
+import re
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
 from plotly.subplots import make_subplots
-import warnings
-warnings.filterwarnings('ignore')
 
 # Page config
 st.set_page_config(
@@ -15,7 +16,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better visuals
-st.markdown("""
+_CSS = """
 <style>
     /* Main container styling */
     .main {
@@ -112,12 +113,38 @@ st.markdown("""
         font-size: 0.85rem;
         display: inline-block;
     }
+    
+    /* Static reference tables */
+    .mmm-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 0.5rem 0 1rem 0;
+        font-size: 0.9rem;
+    }
+    
+    .mmm-table th {
+        background: #f0f2f6;
+        color: #2c5282;
+        text-align: left;
+    }
+    
+    .mmm-table th, .mmm-table td {
+        border: 1px solid #e3e6e9;
+        padding: 0.4rem 0.6rem;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+# The style block has to be sent on every rerun (elements a rerun does not
+# emit are cleared), so strip comments and indentation once at import
+_CSS = re.sub(r'\s*([{};])\s*', r'\1',
+              re.sub(r'\s+', ' ', re.sub(r'/\*.*?\*/', '', _CSS, flags=re.S))).strip()
+st.markdown(_CSS, unsafe_allow_html=True)
 
-# Header
-st.markdown("# 📊 MMM Common Pitfalls 101: A Beginner's Guide")
-st.markdown("""
+# =============================================================================
+# STATIC HTML BLOCKS
+# =============================================================================
+
+_INTRO_HTML = """
 <div class="info-box">
 <h4>🎯 Welcome to Your MMM Troubleshooting Guide!</h4>
 <p>Think of Marketing Mix Modeling (MMM) as detective work - you're trying to figure out which marketing channels are actually driving sales. 
@@ -125,39 +152,447 @@ But there are 6 common traps that can fool even experienced detectives. This gui
 <p><strong>How to use this guide:</strong> Scroll through each section to understand the problem, see real examples, and learn solutions. 
 Green boxes = helpful tips, Orange boxes = beginner notes, Red boxes = warnings.</p>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-# Quick overview
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("Easy to Understand", "2 Pitfalls", "But tricky to fix")
-with col2:
-    st.metric("Tricky to Understand", "4 Pitfalls", "Need technical knowledge")
-with col3:
-    st.metric("Business Impact", "$1-10M", "Per mistake!")
+_PITFALL1_BEGINNER = """
+<div class="beginner-note">
+<strong>🔰 Beginner's Note:</strong> This is the "garbage in, garbage out" problem. Imagine trying to bake a cake but your recipe says 
+"2 cups" in one place and "3 cups" in another place for the same ingredient. Which do you trust? That's what happens when different 
+departments report different numbers for the same marketing spend.
+</div>
+"""
 
-st.markdown("---")
+_PITFALL1_READING = """
+<div class="beginner-note">
+<strong>What you're seeing:</strong> Four different sources reporting different numbers for the same thing! 
+Facebook spend varies by $10K depending on who you ask. The Agency doesn't even have TV data (that's the "Missing" bar).
+</div>
+"""
 
-# =============================================================================
-# PITFALL 1: DATA QUALITY ISSUES
-# =============================================================================
+_PITFALL1_CAUSES = """
+<div class="warning-box">
+<strong>Common Causes:</strong>
+<ul>
+<li><strong>Time zones:</strong> Platform uses PST, Finance uses EST</li>
+<li><strong>Date ranges:</strong> Calendar month vs 30-day rolling</li>
+<li><strong>Currency:</strong> Some in USD, others in local currency</li>
+<li><strong>Taxes:</strong> Some include VAT, others don't</li>
+<li><strong>Credits:</strong> Platform credits not reflected in finance</li>
+</ul>
+</div>
+"""
+
+_PITFALL1_SOLUTION = """
+<div class="solution-box">
+<strong>Simple Fix:</strong>
+<ol>
+<li><strong>Pick ONE source of truth</strong> (usually the platform itself)</li>
+<li><strong>Document your choice</strong> so everyone knows</li>
+<li><strong>Check monthly</strong> that sources still match</li>
+<li><strong>Create a data dictionary</strong> defining each metric</li>
+</ol>
 
-st.markdown("## 1️⃣ Data Quality Issues")
-st.markdown('<span class="easy-badge">EASY TO UNDERSTAND</span>', unsafe_allow_html=True)
+<strong>Pro tip:</strong> Platform data (like Facebook Ads Manager) is usually most accurate because 
+that's where the spending actually happens!
+</div>
+"""
 
-st.markdown("""
+_PITFALL2_BEGINNER = """
 <div class="beginner-note">
-<strong>🔰 Beginner's Note:</strong> This is the "garbage in, garbage out" problem. Imagine trying to bake a cake but your recipe says 
-"2 cups" in one place and "3 cups" in another place for the same ingredient. Which do you trust? That's what happens when different 
-departments report different numbers for the same marketing spend.
+<strong>🔰 Beginner's Note:</strong> Imagine your ice cream sales dropped 50% in winter. Was it bad marketing or just cold weather? 
+External factors are things outside marketing that affect sales - like COVID, competitors, economy, weather. If you don't account 
+for them, marketing gets unfairly blamed (or praised) for things it didn't do.
 </div>
-""", unsafe_allow_html=True)
+"""
 
-col1, col2 = st.columns([1, 1])
+_PITFALL2_READING = """
+<div class="beginner-note">
+<strong>What you're seeing:</strong> Sales dropped 50% in April 2020 (COVID) while marketing spend stayed the same. 
+Without modeling COVID as an external factor, your model would think marketing suddenly became terrible!
+</div>
+"""
 
-with col1:
-    st.markdown("### 📊 The Problem Visualized")
-    
+_PITFALL2_SOLUTION = """
+<div class="solution-box">
+<strong>How to Fix It:</strong>
+<ol>
+<li><strong>List everything</strong> that could affect sales (brainstorm with team)</li>
+<li><strong>Get the data</strong> (most is free - Google Trends, weather, economic data)</li>
+<li><strong>Add to your model</strong> as control variables</li>
+<li><strong>Check if it matters</strong> (if correlation > 0.3 with sales, keep it)</li>
+</ol>
+
+<strong>Remember:</strong> It's better to include too many factors than too few. 
+You can always remove ones that don't matter!
+</div>
+"""
+
+_PITFALL3_BEGINNER = """
+<div class="beginner-note">
+<strong>🔰 Beginner's Note:</strong> Imagine Batman and Robin always fight crime together. If crime goes down, who gets the credit? 
+It's impossible to tell! That's multicollinearity - when two marketing channels always run together (like TV and Radio), 
+the model can't figure out which one is actually working.
+</div>
+"""
+
+_PITFALL3_READING = """
+<div class="beginner-note">
+<strong>What you're seeing:</strong> TV (blue) and Radio (red) follow almost the same pattern - when one goes up, 
+the other goes up. Digital (green) does its own thing. The model can't tell if sales increases are from TV or Radio!
+</div>
+"""
+
+_PITFALL3_HEATMAP_READING = """
+<div class="beginner-note">
+<strong>Reading this chart:</strong> Numbers close to 1 (red) mean channels move together. 
+TV-Radio = 0.95 is BAD (too similar). TV-Digital = 0.2 is GOOD (independent).
+</div>
+"""
+
+_PITFALL3_SOLUTION = """
+<div class="solution-box">
+<strong>How to Fix It:</strong>
+<ol>
+<li><strong>Quick fix:</strong> Combine TV + Radio into "Traditional Media"</li>
+<li><strong>Better fix:</strong> Run them at different times (TV only in Q1, Radio only in Q2)</li>
+<li><strong>Technical fix:</strong> Use Ridge Regression (handles correlation better)</li>
+<li><strong>Best fix:</strong> Design tests where they don't overlap</li>
+</ol>
+
+<strong>Rule of thumb:</strong> If correlation > 0.7, you have a problem!
+</div>
+"""
+
+_PITFALL4_BEGINNER = """
+<div class="beginner-note">
+<strong>🔰 Beginner's Note:</strong> When you see a TV ad today, do you buy immediately or next week? Attribution windows 
+answer "how long does advertising keep working?" It's like asking how long medicine stays in your system - some work 
+instantly and fade fast (like coffee), others build up over time (like vitamins).
+</div>
+"""
+
+_PITFALL4_READING = """
+<div class="beginner-note">
+<strong>What you're seeing:</strong> The SAME campaign shows 2x ROI if you only measure 2 weeks, 
+but 4.5x ROI if you measure 8 weeks! Most of TV's impact comes later. It's like planting a tree - 
+you don't see all the fruit on day one.
+</div>
+"""
+
+_PITFALL4_SOLUTION = """
+<div class="solution-box">
+<strong>How to Get It Right:</strong>
+<ol>
+<li><strong>Start with benchmarks</strong> (TV: 8-13 weeks, Digital: 1-4 weeks)</li>
+<li><strong>Test different windows</strong> and see which fits best</li>
+<li><strong>Use business sense</strong> (B2B = longer, B2C = shorter)</li>
+<li><strong>Validate with tests</strong> (turn off channel, see how long effect lasts)</li>
+</ol>
+</div>
+"""
+
+_PITFALL5_BEGINNER = """
+<div class="beginner-note">
+<strong>🔰 Beginner's Note:</strong> Imagine filling a sponge with water. At first, it absorbs everything. 
+Then it starts dripping. Finally, it can't hold anymore - that's saturation! In marketing, it's the point where 
+spending more doesn't help. The problem? If your model thinks the sponge is full at 25%, you'll stop way too early!
+</div>
+"""
+
+_PITFALL5_READING = """
+<div class="beginner-note">
+<strong>What you're seeing:</strong> The red line (wrong model) flattens at $500K, suggesting more spend is wasteful. 
+But the green line (reality) keeps growing! You're at the blue star, competitors at orange diamond. 
+You're leaving money on the table!
+</div>
+"""
+
+_PITFALL5_SOLUTION = """
+<div class="solution-box">
+<strong>Industry Benchmarks (Monthly):</strong>
+<ul>
+<li>📺 <strong>TV:</strong> $1-3M (builds brand slowly)</li>
+<li>🔍 <strong>Search:</strong> $50-200K (limited search volume)</li>
+<li>📱 <strong>Social:</strong> $200-800K (audience gets tired)</li>
+<li>📻 <strong>Radio:</strong> $300K-1M (regional limits)</li>
+</ul>
+
+<strong>How to Fix:</strong>
+<ol>
+<li><strong>Check competitors:</strong> If they spend 4x more successfully, your curve is wrong</li>
+<li><strong>Test higher spend:</strong> Try 2x spend in one market</li>
+<li><strong>Try different curves:</strong> S-curve, logarithmic, linear-to-plateau</li>
+<li><strong>Use common sense:</strong> Can't exceed total market size!</li>
+</ol>
+</div>
+"""
+
+_PITFALL6_BEGINNER = """
+<div class="beginner-note">
+<strong>🔰 Beginner's Note:</strong> Your business has "baseline" sales - what you'd sell with zero marketing. 
+But this baseline changes! Maybe your brand is getting stronger, or the market is growing. It's like a rising tide 
+lifting all boats. The problem: if sales go up 20% but marketing stays flat, who gets credit? Without accounting 
+for baseline drift, marketing might claim success it didn't earn (or get blamed for failure it didn't cause).
+</div>
+"""
+
+_PITFALL6_READING = """
+<div class="beginner-note">
+<strong>What you're seeing:</strong> Total sales (green + blue) grew 20%. Marketing spend (red dashed) stayed flat. 
+The green area (baseline) is growing naturally - maybe brand strength, market growth, or word-of-mouth. 
+Without modeling this drift, marketing looks like a superstar when it's really just riding the wave!
+</div>
+"""
+
+_PITFALL6_WARNING = """
+<div class="warning-box">
+<strong>Scenario 1:</strong> Baseline growing (brand getting stronger)
+<ul>
+<li>Marketing gets credit for organic growth</li>
+<li>ROI looks inflated (5x instead of true 2x)</li>
+<li>You overspend thinking marketing is amazing</li>
+</ul>
+
+<strong>Scenario 2:</strong> Baseline declining (market shrinking)
+<ul>
+<li>Marketing blamed for market decline</li>
+<li>ROI looks terrible (0.5x instead of true 2x)</li>
+<li>You cut budget when marketing is actually working</li>
+</ul>
+</div>
+"""
+
+_PITFALL6_SOLUTION = """
+<div class="solution-box">
+<strong>How to Account for Drift:</strong>
+<ol>
+<li><strong>Add a trend line</strong> (growing/declining baseline)</li>
+<li><strong>Include time as a variable</strong> in your model</li>
+<li><strong>Track brand metrics</strong> (awareness, consideration)</li>
+<li><strong>Model step changes</strong> (new store openings, competitor exits)</li>
+<li><strong>Refresh models quarterly</strong> (baselines change!)</li>
+</ol>
+
+<strong>Simple test:</strong> Plot sales vs marketing over time. If they diverge, you have drift!
+</div>
+"""
+
+_CHECKLIST_HTML = """
+<div class="info-box">
+<h4>Your MMM Pitfall Checklist</h4>
+<p>Run through this list before trusting any MMM results:</p>
+</div>
+"""
+
+_NEXT_STEPS_HTML = """
+<div class="solution-box">
+<h4>🚀 Next Steps:</h4>
+<ol>
+<li><strong>Start with data quality</strong> - it's the foundation</li>
+<li><strong>Check for multicollinearity</strong> - it can flip results completely</li>
+<li><strong>Test different windows and curves</strong> - assumptions matter</li>
+<li><strong>Always include external factors</strong> - context is crucial</li>
+<li><strong>Monitor for drift</strong> - baselines change over time</li>
+</ol>
+
+<strong>Remember:</strong> These pitfalls often occur together. A model with bad data AND wrong saturation AND missing COVID 
+will be completely useless. Fix them one by one!
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 2rem;">
+<p><strong>MMM Common Pitfalls 101</strong> | A Beginner's Guide to Marketing Mix Modeling</p>
+</div>
+"""
+
+_BADGE_TEXT = {
+    'easy': 'EASY TO UNDERSTAND',
+    'tricky': 'TRICKY TO UNDERSTAND'
+}
+
+def _section_header(number, title, difficulty):
+    """Separator, heading and difficulty badge of a pitfall as one HTML block"""
+    return (f'<hr/>\n<h2>{number} {title}</h2>\n'
+            f'<span class="{difficulty}-badge">{_BADGE_TEXT[difficulty]}</span>')
+
+# =============================================================================
+# REFERENCE TABLES
+# =============================================================================
+# The tables are small and static, so they are rendered to plain HTML once at
+# import instead of mounting an interactive dataframe on every run.
+
+def _table_html(columns):
+    """Render a dict of columns as a static HTML table"""
+    return pd.DataFrame(columns).to_html(index=False, border=0, classes='mmm-table')
+
+_FACTORS_HTML = _table_html({
+    'Factor': ['🦠 COVID-19', '💰 Economy', '🏢 Competitors', '☀️ Weather', 
+               '📅 Holidays', '📰 PR Events'],
+    'Example Impact': ['-40% sales', '±15% sales', '-20% share', '±10% sales', 
+                      '+30% sales', '±25% sales'],
+    'How to Measure': ['Google Mobility', 'GDP/Unemployment', 'Their ad spend', 
+                      'Temperature', 'Calendar', 'Google Trends']
+})
+
+_PROBLEM_HTML = _table_html({
+    'Channel': ['TV', 'Radio', 'Digital'],
+    'True Effect': ['+$2.50 per $1', '+$2.00 per $1', '+$3.00 per $1'],
+    'Model Says': ['+$5.00 per $1 😱', '-$1.00 per $1 ❌', '+$3.00 per $1 ✅'],
+    'Problem?': ['Gets all credit!', 'Looks harmful!', 'Correct']
+})
+
+_DECAY_HTML = _table_html({
+    'Channel': ['🔍 Search', '📱 Social', '📺 TV', '📻 Radio'],
+    'Decay Speed': ['Very Fast', 'Fast', 'Slow', 'Medium'],
+    'Lasts For': ['1-2 weeks', '2-4 weeks', '8-13 weeks', '4-8 weeks'],
+    'Why?': ['Intent-based', 'Engagement fades', 'Brand building', 'Reminder effect']
+})
+
+_IMPACT_HTML = _table_html({
+    'Spend Level': ['$500K (You)', '$1M', '$2M (Competitor)'],
+    'Wrong Model Says': ['✅ Optimal', '🚫 Wasteful', '🚫 Terrible'],
+    'Reality Is': ['⚠️ Too Low', '✅ Good', '✅ Near Optimal'],
+    'Lost Revenue': ['$0', '$500K/year', '$1.5M/year']
+})
+
+_CAUSES_HTML = _table_html({
+    'Cause': ['📈 Brand Building', '🌍 Market Growth', '🏪 Distribution', 
+              '💬 Word of Mouth', '🏢 Less Competition'],
+    'Direction': ['↗️ Up', '↗️ Up', '↗️ Up', '↗️ Up', '↗️ Up'],
+    'Example': ['+2% monthly', '+5% yearly', 'New stores', 'Going viral', 'Competitor left'],
+    'Impact': ['Slow & steady', 'Industry-wide', 'Step change', 'Exponential', 'Sudden jump']
+})
+
+# Summary columns, kept as immutable module-level tuples
+_SUMMARY_PITFALL = ('Data Quality', 'External Factors', 'Multicollinearity',
+                    'Attribution Windows', 'Saturation', 'Baseline Drift')
+_SUMMARY_TEST = ('Compare 3 data sources', 'List 5 external events', 'Check correlation > 0.7',
+                 'Try 2, 8, 13 week windows', 'Compare to competitors', 'Plot sales vs spend trend')
+_SUMMARY_RED_FLAG = ('Numbers differ by >10%', 'Major event not modeled', 'Negative coefficients',
+                     'ROI changes by >2x', 'Saturating too early', 'Lines diverging')
+_SUMMARY_FIX = ('Use platform data', 'Add COVID dummy', 'Combine channels',
+                'Use 8-week default', 'Test higher spend', 'Add trend line')
+
+_SUMMARY_HTML = _table_html({
+    'Pitfall': _SUMMARY_PITFALL,
+    'Quick Test': _SUMMARY_TEST,
+    'Red Flag': _SUMMARY_RED_FLAG,
+    'Quick Fix': _SUMMARY_FIX
+})
+
+# Right-hand columns without a chart are composed into one HTML block each,
+# so they render as a single element instead of alternating headings and boxes
+_PITFALL1_RIGHT_HTML = (
+    '<h3>🔍 Why This Happens</h3>'
+    + _PITFALL1_CAUSES
+    + '<h3>✅ The Solution</h3>'
+    + _PITFALL1_SOLUTION
+)
+
+_PITFALL2_RIGHT_HTML = (
+    '<h3>🌍 Common External Factors to Include</h3>'
+    + _FACTORS_HTML
+    + '<h3>✅ The Solution</h3>'
+    + _PITFALL2_SOLUTION
+)
+
+_PITFALL5_RIGHT_HTML = (
+    '<h3>💰 The Business Impact</h3>'
+    + _IMPACT_HTML
+    + '<h3>🎯 Common Saturation Points</h3>'
+    + _PITFALL5_SOLUTION
+)
+
+_PITFALL6_RIGHT_HTML = (
+    '<h3>🌊 What Causes Baseline to Drift?</h3>'
+    + _CAUSES_HTML
+    + '<h3>⚠️ What Goes Wrong Without Drift Modeling</h3>'
+    + _PITFALL6_WARNING
+    + '<h3>✅ The Solution</h3>'
+    + _PITFALL6_SOLUTION
+)
+
+# The whole static summary, from heading to footer, goes out as one element
+_QUICK_REFERENCE_HTML = (
+    '<h2>🎯 Quick Reference Guide</h2>'
+    + _CHECKLIST_HTML
+    + _SUMMARY_HTML
+    + _NEXT_STEPS_HTML
+    + '<hr/>'
+    + _FOOTER_HTML
+)
+
+# =============================================================================
+# CHART DATA
+# =============================================================================
+# Fixed series behind the charts, built once as typed arrays at import time.
+# Month axes are ISO date strings, which Plotly reads as dates without
+# converting Timestamps on every serialization.
+
+# Pitfall 2: monthly sales through COVID against constant marketing spend
+_MONTHS_2020 = pd.date_range('2020-01-01', periods=24, freq='ME').strftime('%Y-%m-%d').tolist()
+_SALES_COVID = np.array([100, 102, 98, 60, 55, 50, 55, 60, 70, 75, 80, 85,
+                         88, 90, 92, 94, 96, 98, 100, 102, 104, 106, 108, 110], dtype=np.float32)
+_MARKETING_SPEND_COVID = np.full(24, 50, dtype=np.float32)
+
+# Pitfall 3: weekly channel spend
+_SPEND_WEEKS = np.arange(1, 13)
+_TV_SPEND = np.array([10, 20, 15, 25, 30, 20, 35, 25, 18, 22, 28, 15], dtype=np.float32)
+_RADIO_SPEND = _TV_SPEND - 1.0  # Almost same as TV
+_DIGITAL_SPEND = np.array([30, 25, 35, 20, 28, 32, 25, 30, 35, 28, 22, 30], dtype=np.float32)  # Independent
+_CORR_MATRIX = np.array([[1.0, 0.95, 0.2],
+                         [0.95, 1.0, 0.15],
+                         [0.2, 0.15, 1.0]], dtype=np.float32)
+_CORR_TEXT = [[f'{val:.2f}' for val in row] for row in _CORR_MATRIX]
+
+# Pitfall 4: share of the effect remaining in the weeks after the ad
+_DECAY_WEEKS = np.arange(0, 13)
+_TV_DECAY = 100.0 * (0.7 ** _DECAY_WEEKS)  # Slow decay
+_DIGITAL_DECAY = 100.0 * (0.2 ** _DECAY_WEEKS)  # Fast decay
+
+# Pitfall 5: saturation curves over monthly spend
+_SPEND_GRID = np.linspace(0, 3000, 100, dtype=np.float32)
+_WRONG_CURVE = 75.0 * (1.0 - np.exp(-_SPEND_GRID / 200.0))  # Saturates early
+_RIGHT_CURVE = 95.0 * (1.0 - np.exp(-_SPEND_GRID / 1500.0))  # Saturates later
+
+# Pitfall 6: growing baseline with flat marketing
+_MONTHS_2023 = pd.date_range('2023-01-01', periods=12, freq='ME').strftime('%Y-%m-%d').tolist()
+_BASELINE_2023 = np.linspace(100, 120, 12, dtype=np.float32)  # Growing baseline
+_MARKETING_CONTRIBUTION_2023 = np.array([5, 4, 6, 5, 5, 4, 6, 5, 5, 4, 5, 5], dtype=np.float32)  # Flat
+_MARKETING_SPEND_INDEX_2023 = np.full(12, 100, dtype=np.float32)  # Flat spend
+
+# =============================================================================
+# FIGURE BUILDERS
+# =============================================================================
+# Every figure is built from constant inputs, so each one is cached and only
+# constructed on the first run of the script. The builders cache the plain
+# figure dict rather than the mutable Figure object, which is cheaper to copy
+# out of the cache and is handed to st.plotly_chart as-is.
+
+# Layout shared by every figure lives in one registered template, so the
+# builders only set their own titles and sizes instead of repeating the
+# margins, background, font and hover settings. Each figure names it on top
+# of Streamlit's theme; the process-wide Plotly default is left alone.
+pio.templates['mmm'] = go.layout.Template(layout=dict(
+    margin=dict(l=40, r=20, t=50, b=40),
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(size=12),
+    hovermode='x unified'
+))
+_TEMPLATE = 'streamlit+mmm'
+
+# No mode bar keeps the charts uncluttered
+_PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+def _format_spend(values):
+    """'$55K' style bar labels, with 'Missing' for NaN"""
+    return np.where(np.isnan(values), 'Missing', np.char.mod('$%.0fK', values / 1000))
+
+@st.cache_data(show_spinner=False)
+def _fig_data_sources():
+    """Grouped bar chart of spend reported by each data source"""
     # Create data discrepancy visualization
     data_sources = pd.DataFrame({
         'Source': ['Meta Platform', 'Finance Dept', 'Agency', 'Data Warehouse'],
@@ -165,693 +600,444 @@ with col1:
         'Google Spend': [80000, 78000, 85000, 79000],
         'TV Spend': [120000, 125000, np.nan, 122000]
     })
-    
-    fig = go.Figure()
+
     colors = ['#4c78a8', '#f28e2c', '#e15759']
+    traces = []
     for i, col in enumerate(['Facebook Spend', 'Google Spend', 'TV Spend']):
-        fig.add_trace(go.Bar(
+        values = data_sources[col].to_numpy()
+        traces.append(go.Bar(
             name=col.replace(' Spend', ''),
             x=data_sources['Source'],
-            y=data_sources[col],
-            text=data_sources[col].apply(lambda x: f'${x/1000:.0f}K' if pd.notna(x) else 'Missing'),
+            y=values,
+            text=_format_spend(values),
             textposition='auto',
             marker_color=colors[i],
             opacity=0.8
         ))
-    
-    fig.update_layout(
+
+    return go.Figure(data=traces, layout=dict(
+        template=_TEMPLATE,
         title="Same Data, Different Numbers - Who's Right?",
         xaxis_title="Where You Get The Data",
         yaxis_title="How Much They Say You Spent ($)",
         barmode='group',
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=12),
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>What you're seeing:</strong> Four different sources reporting different numbers for the same thing! 
-    Facebook spend varies by $10K depending on who you ask. The Agency doesn't even have TV data (that's the "Missing" bar).
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("### 🔍 Why This Happens")
-    
-    st.markdown("""
-    <div class="warning-box">
-    <strong>Common Causes:</strong>
-    <ul>
-    <li><strong>Time zones:</strong> Platform uses PST, Finance uses EST</li>
-    <li><strong>Date ranges:</strong> Calendar month vs 30-day rolling</li>
-    <li><strong>Currency:</strong> Some in USD, others in local currency</li>
-    <li><strong>Taxes:</strong> Some include VAT, others don't</li>
-    <li><strong>Credits:</strong> Platform credits not reflected in finance</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("### ✅ The Solution")
-    
-    st.markdown("""
-    <div class="solution-box">
-    <strong>Simple Fix:</strong>
-    <ol>
-    <li><strong>Pick ONE source of truth</strong> (usually the platform itself)</li>
-    <li><strong>Document your choice</strong> so everyone knows</li>
-    <li><strong>Check monthly</strong> that sources still match</li>
-    <li><strong>Create a data dictionary</strong> defining each metric</li>
-    </ol>
-    
-    <strong>Pro tip:</strong> Platform data (like Facebook Ads Manager) is usually most accurate because 
-    that's where the spending actually happens!
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown("---")
-
-# =============================================================================
-# PITFALL 2: EXTERNAL FACTOR OMISSION
-# =============================================================================
+        height=400
+    )).to_dict()
 
-st.markdown("## 2️⃣ External Factor Omission (Confounders)")
-st.markdown('<span class="easy-badge">EASY TO UNDERSTAND</span>', unsafe_allow_html=True)
-
-st.markdown("""
-<div class="beginner-note">
-<strong>🔰 Beginner's Note:</strong> Imagine your ice cream sales dropped 50% in winter. Was it bad marketing or just cold weather? 
-External factors are things outside marketing that affect sales - like COVID, competitors, economy, weather. If you don't account 
-for them, marketing gets unfairly blamed (or praised) for things it didn't do.
-</div>
-""", unsafe_allow_html=True)
-
-col1, col2 = st.columns([1, 1])
-
-with col1:
-    st.markdown("### 📉 What Happens When You Forget External Factors")
-    
-    # Create a simple visualization showing sales drop
-    dates = pd.date_range('2020-01-01', periods=24, freq='M')
-    sales_with_covid = [100, 102, 98, 60, 55, 50, 55, 60, 70, 75, 80, 85, 
-                        88, 90, 92, 94, 96, 98, 100, 102, 104, 106, 108, 110]
-    marketing_spend = [50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50,
-                      50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=dates, y=sales_with_covid,
-        name='Sales',
-        line=dict(color='#4c78a8', width=3),
-        fill='tozeroy',
-        fillcolor='rgba(76, 120, 168, 0.1)'
-    ))
-    fig.add_trace(go.Scatter(
-        x=dates, y=marketing_spend,
-        name='Marketing Spend (Constant)',
-        line=dict(color='#e15759', width=2, dash='dash')
-    ))
-    
-    # Add COVID annotation
-    fig.add_annotation(
-        x='2020-04-01', y=60,
-        text="COVID hits",
-        showarrow=True,
-        arrowhead=2,
-        arrowcolor='red',
-        ax=-50, ay=-30
-    )
-    
-    fig.update_layout(
+@st.cache_data(show_spinner=False)
+def _fig_covid_sales():
+    """Sales vs constant marketing spend through the COVID drop"""
+    return go.Figure(data=[
+        go.Scattergl(
+            x=_MONTHS_2020, y=_SALES_COVID,
+            name='Sales',
+            line=dict(color='#4c78a8', width=3),
+            fill='tozeroy',
+            fillcolor='rgba(76, 120, 168, 0.1)'
+        ),
+        go.Scattergl(
+            x=_MONTHS_2020, y=_MARKETING_SPEND_COVID,
+            name='Marketing Spend (Constant)',
+            line=dict(color='#e15759', width=2, dash='dash')
+        )
+    ], layout=dict(
+        template=_TEMPLATE,
         title="Sales Crashed But Marketing Didn't Change - What Happened?",
         xaxis_title="Date",
         yaxis_title="Index (Jan 2020 = 100)",
         height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>What you're seeing:</strong> Sales dropped 50% in April 2020 (COVID) while marketing spend stayed the same. 
-    Without modeling COVID as an external factor, your model would think marketing suddenly became terrible!
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("### 🌍 Common External Factors to Include")
-    
-    factors_df = pd.DataFrame({
-        'Factor': ['🦠 COVID-19', '💰 Economy', '🏢 Competitors', '☀️ Weather', 
-                   '📅 Holidays', '📰 PR Events'],
-        'Example Impact': ['-40% sales', '±15% sales', '-20% share', '±10% sales', 
-                          '+30% sales', '±25% sales'],
-        'How to Measure': ['Google Mobility', 'GDP/Unemployment', 'Their ad spend', 
-                          'Temperature', 'Calendar', 'Google Trends']
-    })
-    st.dataframe(factors_df, use_container_width=True, hide_index=True)
-    
-    st.markdown("### ✅ The Solution")
-    
-    st.markdown("""
-    <div class="solution-box">
-    <strong>How to Fix It:</strong>
-    <ol>
-    <li><strong>List everything</strong> that could affect sales (brainstorm with team)</li>
-    <li><strong>Get the data</strong> (most is free - Google Trends, weather, economic data)</li>
-    <li><strong>Add to your model</strong> as control variables</li>
-    <li><strong>Check if it matters</strong> (if correlation > 0.3 with sales, keep it)</li>
-    </ol>
-    
-    <strong>Remember:</strong> It's better to include too many factors than too few. 
-    You can always remove ones that don't matter!
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown("---")
-
-# =============================================================================
-# PITFALL 3: MULTICOLLINEARITY
-# =============================================================================
-
-st.markdown("## 3️⃣ Multicollinearity")
-st.markdown('<span class="tricky-badge">TRICKY TO UNDERSTAND</span>', unsafe_allow_html=True)
-
-st.markdown("""
-<div class="beginner-note">
-<strong>🔰 Beginner's Note:</strong> Imagine Batman and Robin always fight crime together. If crime goes down, who gets the credit? 
-It's impossible to tell! That's multicollinearity - when two marketing channels always run together (like TV and Radio), 
-the model can't figure out which one is actually working.
-</div>
-""", unsafe_allow_html=True)
+        # COVID annotation
+        annotations=[dict(
+            x='2020-04-01', y=60,
+            text="COVID hits",
+            showarrow=True,
+            arrowhead=2,
+            arrowcolor='red',
+            ax=-50, ay=-30
+        )]
+    )).to_dict()
 
-col1, col2 = st.columns([1, 1])
-
-with col1:
-    st.markdown("### 🔗 The Problem: Channels Moving Together")
-    
-    # Generate correlated data
-    np.random.seed(42)
-    weeks = list(range(1, 13))
-    tv_spend = [10, 20, 15, 25, 30, 20, 35, 25, 18, 22, 28, 15]
-    radio_spend = [9, 19, 14, 24, 29, 19, 34, 24, 17, 21, 27, 14]  # Almost same as TV
-    digital_spend = [30, 25, 35, 20, 28, 32, 25, 30, 35, 28, 22, 30]  # Independent
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=weeks, y=tv_spend, name='TV', 
-                            line=dict(color='#4c78a8', width=3),
-                            mode='lines+markers'))
-    fig.add_trace(go.Scatter(x=weeks, y=radio_spend, name='Radio', 
-                            line=dict(color='#e15759', width=3, dash='dash'),
-                            mode='lines+markers'))
-    fig.add_trace(go.Scatter(x=weeks, y=digital_spend, name='Digital', 
-                            line=dict(color='#54a24b', width=2),
-                            mode='lines+markers'))
-    
-    fig.update_layout(
+@st.cache_data(show_spinner=False)
+def _fig_channel_spend():
+    """Weekly TV, Radio and Digital spend lines"""
+    return go.Figure(data=[
+        go.Scattergl(x=_SPEND_WEEKS, y=_TV_SPEND, name='TV',
+                     line=dict(color='#4c78a8', width=3),
+                     mode='lines+markers'),
+        go.Scattergl(x=_SPEND_WEEKS, y=_RADIO_SPEND, name='Radio',
+                     line=dict(color='#e15759', width=3, dash='dash'),
+                     mode='lines+markers'),
+        go.Scattergl(x=_SPEND_WEEKS, y=_DIGITAL_SPEND, name='Digital',
+                     line=dict(color='#54a24b', width=2),
+                     mode='lines+markers')
+    ], layout=dict(
+        template=_TEMPLATE,
         title="TV and Radio Move Together - Model Gets Confused!",
         xaxis_title="Week",
         yaxis_title="Spend ($K)",
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>What you're seeing:</strong> TV (blue) and Radio (red) follow almost the same pattern - when one goes up, 
-    the other goes up. Digital (green) does its own thing. The model can't tell if sales increases are from TV or Radio!
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Show the problem
-    st.markdown("### ⚠️ What Goes Wrong")
-    
-    problem_df = pd.DataFrame({
-        'Channel': ['TV', 'Radio', 'Digital'],
-        'True Effect': ['+$2.50 per $1', '+$2.00 per $1', '+$3.00 per $1'],
-        'Model Says': ['+$5.00 per $1 😱', '-$1.00 per $1 ❌', '+$3.00 per $1 ✅'],
-        'Problem?': ['Gets all credit!', 'Looks harmful!', 'Correct']
-    })
-    st.dataframe(problem_df, use_container_width=True, hide_index=True)
+        height=400
+    )).to_dict()
 
-with col2:
-    st.markdown("### 🔬 How to Detect It")
-    
-    # Create correlation heatmap
-    corr_matrix = [[1.0, 0.95, 0.2],
-                   [0.95, 1.0, 0.15],
-                   [0.2, 0.15, 1.0]]
-    
-    fig = go.Figure(data=go.Heatmap(
-        z=corr_matrix,
+@st.cache_data(show_spinner=False)
+def _fig_correlation_heatmap():
+    """Correlation heatmap of TV, Radio and Digital spend"""
+    return go.Figure(data=[go.Heatmap(
+        z=_CORR_MATRIX,
         x=['TV', 'Radio', 'Digital'],
         y=['TV', 'Radio', 'Digital'],
         colorscale='RdBu',
         zmid=0,
-        text=[[f'{val:.2f}' for val in row] for row in corr_matrix],
+        text=_CORR_TEXT,
         texttemplate='%{text}',
         textfont={"size": 14},
         colorbar=dict(title="Correlation"),
         reversescale=True
-    ))
-    
-    fig.update_layout(
+    )], layout=dict(
+        template=_TEMPLATE,
         title="Correlation Matrix - Red = Problem!",
         height=350,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>Reading this chart:</strong> Numbers close to 1 (red) mean channels move together. 
-    TV-Radio = 0.95 is BAD (too similar). TV-Digital = 0.2 is GOOD (independent).
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("### ✅ Solutions")
-    
-    st.markdown("""
-    <div class="solution-box">
-    <strong>How to Fix It:</strong>
-    <ol>
-    <li><strong>Quick fix:</strong> Combine TV + Radio into "Traditional Media"</li>
-    <li><strong>Better fix:</strong> Run them at different times (TV only in Q1, Radio only in Q2)</li>
-    <li><strong>Technical fix:</strong> Use Ridge Regression (handles correlation better)</li>
-    <li><strong>Best fix:</strong> Design tests where they don't overlap</li>
-    </ol>
-    
-    <strong>Rule of thumb:</strong> If correlation > 0.7, you have a problem!
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown("---")
+        hovermode='closest'
+    )).to_dict()
 
-# =============================================================================
-# PITFALL 4: ATTRIBUTION WINDOWS
-# =============================================================================
-
-st.markdown("## 4️⃣ Attribution Windows (Adstock)")
-st.markdown('<span class="tricky-badge">TRICKY TO UNDERSTAND</span>', unsafe_allow_html=True)
-
-st.markdown("""
-<div class="beginner-note">
-<strong>🔰 Beginner's Note:</strong> When you see a TV ad today, do you buy immediately or next week? Attribution windows 
-answer "how long does advertising keep working?" It's like asking how long medicine stays in your system - some work 
-instantly and fade fast (like coffee), others build up over time (like vitamins).
-</div>
-""", unsafe_allow_html=True)
-
-col1, col2 = st.columns([1, 1])
-
-with col1:
-    st.markdown("### ⏱️ Same Campaign, Different Windows, Different ROI!")
-    
+@st.cache_data(show_spinner=False)
+def _fig_attribution_windows():
+    """Revenue and ROI of one campaign under different attribution windows"""
     # Create bar chart showing different ROIs
     windows = ['1 Week', '2 Weeks', '4 Weeks', '8 Weeks', '13 Weeks']
     revenue = [120, 200, 350, 450, 480]
     roi = [1.2, 2.0, 3.5, 4.5, 4.8]
     colors = ['#e15759', '#e15759', '#f28e2c', '#54a24b', '#54a24b']
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
+
+    return go.Figure(data=[go.Bar(
         x=windows,
         y=revenue,
         text=[f'${r}K<br>ROI: {roi[i]}x' for i, r in enumerate(revenue)],
         textposition='outside',
         marker_color=colors,
         name='Revenue'
-    ))
-    
-    fig.update_layout(
+    )], layout=dict(
+        template=_TEMPLATE,
         title="Same $100K TV Campaign - Measured Different Ways",
         xaxis_title="How Long You Measure",
         yaxis_title="Revenue Attributed ($K)",
         height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        showlegend=False
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>What you're seeing:</strong> The SAME campaign shows 2x ROI if you only measure 2 weeks, 
-    but 4.5x ROI if you measure 8 weeks! Most of TV's impact comes later. It's like planting a tree - 
-    you don't see all the fruit on day one.
-    </div>
-    """, unsafe_allow_html=True)
+        showlegend=False,
+        hovermode='closest'
+    )).to_dict()
 
-with col2:
-    st.markdown("### 📊 How Effects Decay Over Time")
-    
-    # Show decay curves
-    weeks = np.arange(0, 13)
-    tv_decay = 100 * (0.7 ** weeks)  # Slow decay
-    digital_decay = 100 * (0.2 ** weeks)  # Fast decay
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=weeks, y=tv_decay,
-        name='TV (Slow decay)',
-        line=dict(color='#4c78a8', width=3),
-        fill='tozeroy',
-        fillcolor='rgba(76, 120, 168, 0.2)'
-    ))
-    fig.add_trace(go.Scatter(
-        x=weeks, y=digital_decay,
-        name='Search (Fast decay)',
-        line=dict(color='#e15759', width=3),
-        fill='tozeroy',
-        fillcolor='rgba(225, 87, 89, 0.2)'
-    ))
-    
-    fig.update_layout(
+@st.cache_data(show_spinner=False)
+def _fig_decay_curves():
+    """Adstock decay curves for a slow and a fast channel"""
+    return go.Figure(data=[
+        go.Scattergl(
+            x=_DECAY_WEEKS, y=_TV_DECAY,
+            name='TV (Slow decay)',
+            line=dict(color='#4c78a8', width=3),
+            fill='tozeroy',
+            fillcolor='rgba(76, 120, 168, 0.2)'
+        ),
+        go.Scattergl(
+            x=_DECAY_WEEKS, y=_DIGITAL_DECAY,
+            name='Search (Fast decay)',
+            line=dict(color='#e15759', width=3),
+            fill='tozeroy',
+            fillcolor='rgba(225, 87, 89, 0.2)'
+        )
+    ], layout=dict(
+        template=_TEMPLATE,
         title="Different Channels Decay at Different Speeds",
         xaxis_title="Weeks After Ad",
         yaxis_title="Effect Remaining (%)",
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("### ✅ Typical Decay Rates by Channel")
-    
-    decay_df = pd.DataFrame({
-        'Channel': ['🔍 Search', '📱 Social', '📺 TV', '📻 Radio'],
-        'Decay Speed': ['Very Fast', 'Fast', 'Slow', 'Medium'],
-        'Lasts For': ['1-2 weeks', '2-4 weeks', '8-13 weeks', '4-8 weeks'],
-        'Why?': ['Intent-based', 'Engagement fades', 'Brand building', 'Reminder effect']
-    })
-    st.dataframe(decay_df, use_container_width=True, hide_index=True)
-    
-    st.markdown("""
-    <div class="solution-box">
-    <strong>How to Get It Right:</strong>
-    <ol>
-    <li><strong>Start with benchmarks</strong> (TV: 8-13 weeks, Digital: 1-4 weeks)</li>
-    <li><strong>Test different windows</strong> and see which fits best</li>
-    <li><strong>Use business sense</strong> (B2B = longer, B2C = shorter)</li>
-    <li><strong>Validate with tests</strong> (turn off channel, see how long effect lasts)</li>
-    </ol>
-    </div>
-    """, unsafe_allow_html=True)
+        height=400
+    )).to_dict()
 
-st.markdown("---")
+@st.cache_data(show_spinner=False)
+def _fig_saturation():
+    """Wrong vs real saturation curves with current and competitor spend"""
+    return go.Figure(data=[
+        go.Scattergl(
+            x=_SPEND_GRID, y=_WRONG_CURVE,
+            name='Wrong Model (Saturates at $500K)',
+            line=dict(color='#e15759', width=3, dash='dash')
+        ),
+        go.Scattergl(
+            x=_SPEND_GRID, y=_RIGHT_CURVE,
+            name='Reality (Saturates at $2M)',
+            line=dict(color='#54a24b', width=3)
+        ),
+        # Markers
+        go.Scattergl(
+            x=[500], y=[65],
+            mode='markers',
+            name='Your Current Spend',
+            marker=dict(size=15, color='#4c78a8', symbol='star')
+        ),
+        go.Scattergl(
+            x=[2000], y=[85],
+            mode='markers',
+            name='Competitor Spend',
+            marker=dict(size=15, color='#f28e2c', symbol='diamond')
+        )
+    ], layout=dict(
+        template=_TEMPLATE,
+        title="Model Says Stop at $500K, But Competitors Succeed at $2M!",
+        xaxis_title="Monthly Spend ($K)",
+        yaxis_title="Sales Response (%)",
+        height=400
+    )).to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_baseline_drift():
+    """Stacked baseline and marketing effect against flat marketing spend"""
+    return go.Figure(data=[
+        # Stacked area chart
+        go.Scatter(
+            x=_MONTHS_2023, y=_BASELINE_2023,
+            name='Baseline (Hidden)',
+            line=dict(color='#54a24b', width=2),
+            fill='tozeroy',
+            fillcolor='rgba(84, 162, 75, 0.2)',
+            stackgroup='one'
+        ),
+        go.Scatter(
+            x=_MONTHS_2023, y=_MARKETING_CONTRIBUTION_2023,
+            name='Marketing Effect',
+            line=dict(color='#4c78a8', width=2),
+            fill='tonexty',
+            fillcolor='rgba(76, 120, 168, 0.2)',
+            stackgroup='one'
+        ),
+        go.Scatter(
+            x=_MONTHS_2023, y=_MARKETING_SPEND_INDEX_2023,
+            name='Marketing Spend (Flat)',
+            line=dict(color='#e15759', width=3, dash='dash'),
+            yaxis='y2'
+        )
+    ], layout=dict(
+        template=_TEMPLATE,
+        title="Sales Up 20%, Marketing Flat - Is Marketing a Hero or Just Lucky?",
+        xaxis_title="Month",
+        yaxis_title="Sales Index",
+        yaxis2=dict(
+            title="Marketing Spend Index",
+            overlaying='y',
+            side='right',
+            range=[90, 130],
+            automargin=True
+        ),
+        height=400
+    )).to_dict()
 
 # =============================================================================
-# PITFALL 5: SATURATION MISSPECIFICATION
+# PITFALL 1: DATA QUALITY ISSUES
 # =============================================================================
 
-st.markdown("## 5️⃣ Saturation Misspecification")
-st.markdown('<span class="tricky-badge">TRICKY TO UNDERSTAND</span>', unsafe_allow_html=True)
+@st.fragment
+def render_pitfall_1():
+    """Render pitfall 1: Data quality issues"""
+    st.markdown(_section_header("1️⃣", "Data Quality Issues", "easy"), unsafe_allow_html=True)
 
-st.markdown("""
-<div class="beginner-note">
-<strong>🔰 Beginner's Note:</strong> Imagine filling a sponge with water. At first, it absorbs everything. 
-Then it starts dripping. Finally, it can't hold anymore - that's saturation! In marketing, it's the point where 
-spending more doesn't help. The problem? If your model thinks the sponge is full at 25%, you'll stop way too early!
-</div>
-""", unsafe_allow_html=True)
+    st.markdown(_PITFALL1_BEGINNER, unsafe_allow_html=True)
 
-col1, col2 = st.columns([1, 1])
+    col1, col2 = st.columns([1, 1])
 
-with col1:
-    st.markdown("### 📈 Wrong Saturation = Missed Opportunity")
-    
-    # Generate saturation curves
-    spend = np.linspace(0, 3000, 100)
-    wrong_curve = 75 * (1 - np.exp(-spend/200))  # Saturates early
-    right_curve = 95 * (1 - np.exp(-spend/1500))  # Saturates later
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=spend, y=wrong_curve,
-        name='Wrong Model (Saturates at $500K)',
-        line=dict(color='#e15759', width=3, dash='dash')
-    ))
-    fig.add_trace(go.Scatter(
-        x=spend, y=right_curve,
-        name='Reality (Saturates at $2M)',
-        line=dict(color='#54a24b', width=3)
-    ))
-    
-    # Add markers
-    fig.add_trace(go.Scatter(
-        x=[500], y=[65],
-        mode='markers',
-        name='Your Current Spend',
-        marker=dict(size=15, color='#4c78a8', symbol='star')
-    ))
-    fig.add_trace(go.Scatter(
-        x=[2000], y=[85],
-        mode='markers',
-        name='Competitor Spend',
-        marker=dict(size=15, color='#f28e2c', symbol='diamond')
-    ))
-    
-    fig.update_layout(
-        title="Model Says Stop at $500K, But Competitors Succeed at $2M!",
-        xaxis_title="Monthly Spend ($K)",
-        yaxis_title="Sales Response (%)",
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>What you're seeing:</strong> The red line (wrong model) flattens at $500K, suggesting more spend is wasteful. 
-    But the green line (reality) keeps growing! You're at the blue star, competitors at orange diamond. 
-    You're leaving money on the table!
-    </div>
-    """, unsafe_allow_html=True)
+    with col1:
+        st.markdown("### 📊 The Problem Visualized")
+    
+        fig = _fig_data_sources()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL1_READING, unsafe_allow_html=True)
 
-with col2:
-    st.markdown("### 💰 The Business Impact")
+    with col2:
+        st.markdown(_PITFALL1_RIGHT_HTML, unsafe_allow_html=True)
+
+# =============================================================================
+# PITFALL 2: EXTERNAL FACTOR OMISSION
+# =============================================================================
+
+@st.fragment
+def render_pitfall_2():
+    """Render pitfall 2: External factor omission"""
+    st.markdown(_section_header("2️⃣", "External Factor Omission (Confounders)", "easy"), unsafe_allow_html=True)
+
+    st.markdown(_PITFALL2_BEGINNER, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("### 📉 What Happens When You Forget External Factors")
     
-    impact_df = pd.DataFrame({
-        'Spend Level': ['$500K (You)', '$1M', '$2M (Competitor)'],
-        'Wrong Model Says': ['✅ Optimal', '🚫 Wasteful', '🚫 Terrible'],
-        'Reality Is': ['⚠️ Too Low', '✅ Good', '✅ Near Optimal'],
-        'Lost Revenue': ['$0', '$500K/year', '$1.5M/year']
-    })
-    st.dataframe(impact_df, use_container_width=True, hide_index=True)
-    
-    st.markdown("### 🎯 Common Saturation Points")
-    
-    st.markdown("""
-    <div class="solution-box">
-    <strong>Industry Benchmarks (Monthly):</strong>
-    <ul>
-    <li>📺 <strong>TV:</strong> $1-3M (builds brand slowly)</li>
-    <li>🔍 <strong>Search:</strong> $50-200K (limited search volume)</li>
-    <li>📱 <strong>Social:</strong> $200-800K (audience gets tired)</li>
-    <li>📻 <strong>Radio:</strong> $300K-1M (regional limits)</li>
-    </ul>
-    
-    <strong>How to Fix:</strong>
-    <ol>
-    <li><strong>Check competitors:</strong> If they spend 4x more successfully, your curve is wrong</li>
-    <li><strong>Test higher spend:</strong> Try 2x spend in one market</li>
-    <li><strong>Try different curves:</strong> S-curve, logarithmic, linear-to-plateau</li>
-    <li><strong>Use common sense:</strong> Can't exceed total market size!</li>
-    </ol>
-    </div>
-    """, unsafe_allow_html=True)
+        fig = _fig_covid_sales()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL2_READING, unsafe_allow_html=True)
 
-st.markdown("---")
+    with col2:
+        st.markdown(_PITFALL2_RIGHT_HTML, unsafe_allow_html=True)
 
 # =============================================================================
-# PITFALL 6: BASELINE DRIFT
+# PITFALL 3: MULTICOLLINEARITY
 # =============================================================================
 
-st.markdown("## 6️⃣ Baseline Drift")
-st.markdown('<span class="tricky-badge">TRICKY TO UNDERSTAND</span>', unsafe_allow_html=True)
+@st.fragment
+def render_pitfall_3():
+    """Render pitfall 3: Multicollinearity"""
+    st.markdown(_section_header("3️⃣", "Multicollinearity", "tricky"), unsafe_allow_html=True)
 
-st.markdown("""
-<div class="beginner-note">
-<strong>🔰 Beginner's Note:</strong> Your business has "baseline" sales - what you'd sell with zero marketing. 
-But this baseline changes! Maybe your brand is getting stronger, or the market is growing. It's like a rising tide 
-lifting all boats. The problem: if sales go up 20% but marketing stays flat, who gets credit? Without accounting 
-for baseline drift, marketing might claim success it didn't earn (or get blamed for failure it didn't cause).
-</div>
-""", unsafe_allow_html=True)
+    st.markdown(_PITFALL3_BEGINNER, unsafe_allow_html=True)
 
-col1, col2 = st.columns([1, 1])
+    col1, col2 = st.columns([1, 1])
 
-with col1:
-    st.markdown("### 📊 Sales Growing, Marketing Flat - What's Happening?")
-    
-    # Generate baseline drift data
-    months = pd.date_range('2023-01-01', periods=12, freq='M')
-    baseline = np.linspace(100, 120, 12)  # Growing baseline
-    marketing_contribution = [5, 4, 6, 5, 5, 4, 6, 5, 5, 4, 5, 5]  # Flat
-    total_sales = baseline + marketing_contribution
-    marketing_spend_index = [100] * 12  # Flat spend
-    
-    fig = go.Figure()
-    
-    # Add stacked area chart
-    fig.add_trace(go.Scatter(
-        x=months, y=baseline,
-        name='Baseline (Hidden)',
-        line=dict(color='#54a24b', width=2),
-        fill='tozeroy',
-        fillcolor='rgba(84, 162, 75, 0.2)',
-        stackgroup='one'
-    ))
-    fig.add_trace(go.Scatter(
-        x=months, y=marketing_contribution,
-        name='Marketing Effect',
-        line=dict(color='#4c78a8', width=2),
-        fill='tonexty',
-        fillcolor='rgba(76, 120, 168, 0.2)',
-        stackgroup='one'
-    ))
-    fig.add_trace(go.Scatter(
-        x=months, y=marketing_spend_index,
-        name='Marketing Spend (Flat)',
-        line=dict(color='#e15759', width=3, dash='dash'),
-        yaxis='y2'
-    ))
-    
-    fig.update_layout(
-        title="Sales Up 20%, Marketing Flat - Is Marketing a Hero or Just Lucky?",
-        xaxis_title="Month",
-        yaxis_title="Sales Index",
-        yaxis2=dict(
-            title="Marketing Spend Index",
-            overlaying='y',
-            side='right',
-            range=[90, 130]
-        ),
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("""
-    <div class="beginner-note">
-    <strong>What you're seeing:</strong> Total sales (green + blue) grew 20%. Marketing spend (red dashed) stayed flat. 
-    The green area (baseline) is growing naturally - maybe brand strength, market growth, or word-of-mouth. 
-    Without modeling this drift, marketing looks like a superstar when it's really just riding the wave!
-    </div>
-    """, unsafe_allow_html=True)
+    with col1:
+        st.markdown("### 🔗 The Problem: Channels Moving Together")
+    
+        fig = _fig_channel_spend()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL3_READING, unsafe_allow_html=True)
+    
+        # Show the problem
+        st.markdown("### ⚠️ What Goes Wrong")
+    
+        st.markdown(_PROBLEM_HTML, unsafe_allow_html=True)
 
-with col2:
-    st.markdown("### 🌊 What Causes Baseline to Drift?")
-    
-    causes_df = pd.DataFrame({
-        'Cause': ['📈 Brand Building', '🌍 Market Growth', '🏪 Distribution', 
-                  '💬 Word of Mouth', '🏢 Less Competition'],
-        'Direction': ['↗️ Up', '↗️ Up', '↗️ Up', '↗️ Up', '↗️ Up'],
-        'Example': ['+2% monthly', '+5% yearly', 'New stores', 'Going viral', 'Competitor left'],
-        'Impact': ['Slow & steady', 'Industry-wide', 'Step change', 'Exponential', 'Sudden jump']
-    })
-    st.dataframe(causes_df, use_container_width=True, hide_index=True)
-    
-    st.markdown("### ⚠️ What Goes Wrong Without Drift Modeling")
-    
-    st.markdown("""
-    <div class="warning-box">
-    <strong>Scenario 1:</strong> Baseline growing (brand getting stronger)
-    <ul>
-    <li>Marketing gets credit for organic growth</li>
-    <li>ROI looks inflated (5x instead of true 2x)</li>
-    <li>You overspend thinking marketing is amazing</li>
-    </ul>
-    
-    <strong>Scenario 2:</strong> Baseline declining (market shrinking)
-    <ul>
-    <li>Marketing blamed for market decline</li>
-    <li>ROI looks terrible (0.5x instead of true 2x)</li>
-    <li>You cut budget when marketing is actually working</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("### ✅ The Solution")
-    
-    st.markdown("""
-    <div class="solution-box">
-    <strong>How to Account for Drift:</strong>
-    <ol>
-    <li><strong>Add a trend line</strong> (growing/declining baseline)</li>
-    <li><strong>Include time as a variable</strong> in your model</li>
-    <li><strong>Track brand metrics</strong> (awareness, consideration)</li>
-    <li><strong>Model step changes</strong> (new store openings, competitor exits)</li>
-    <li><strong>Refresh models quarterly</strong> (baselines change!)</li>
-    </ol>
-    
-    <strong>Simple test:</strong> Plot sales vs marketing over time. If they diverge, you have drift!
-    </div>
-    """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("### 🔬 How to Detect It")
+    
+        fig = _fig_correlation_heatmap()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL3_HEATMAP_READING, unsafe_allow_html=True)
+    
+        st.markdown("### ✅ Solutions")
+    
+        st.markdown(_PITFALL3_SOLUTION, unsafe_allow_html=True)
 
-st.markdown("---")
+# =============================================================================
+# PITFALL 4: ATTRIBUTION WINDOWS
+# =============================================================================
+
+@st.fragment
+def render_pitfall_4():
+    """Render pitfall 4: Attribution windows"""
+    st.markdown(_section_header("4️⃣", "Attribution Windows (Adstock)", "tricky"), unsafe_allow_html=True)
+
+    st.markdown(_PITFALL4_BEGINNER, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("### ⏱️ Same Campaign, Different Windows, Different ROI!")
+    
+        fig = _fig_attribution_windows()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL4_READING, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("### 📊 How Effects Decay Over Time")
+    
+        fig = _fig_decay_curves()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown("### ✅ Typical Decay Rates by Channel")
+    
+        st.markdown(_DECAY_HTML, unsafe_allow_html=True)
+    
+        st.markdown(_PITFALL4_SOLUTION, unsafe_allow_html=True)
 
 # =============================================================================
-# SUMMARY SECTION
+# PITFALL 5: SATURATION MISSPECIFICATION
 # =============================================================================
 
-st.markdown("## 🎯 Quick Reference Guide")
+@st.fragment
+def render_pitfall_5():
+    """Render pitfall 5: Saturation misspecification"""
+    st.markdown(_section_header("5️⃣", "Saturation Misspecification", "tricky"), unsafe_allow_html=True)
 
-st.markdown("""
-<div class="info-box">
-<h4>Your MMM Pitfall Checklist</h4>
-<p>Run through this list before trusting any MMM results:</p>
-</div>
-""", unsafe_allow_html=True)
-
-# Create summary table
-summary_df = pd.DataFrame({
-    'Pitfall': ['Data Quality', 'External Factors', 'Multicollinearity', 
-                'Attribution Windows', 'Saturation', 'Baseline Drift'],
-    'Quick Test': ['Compare 3 data sources', 'List 5 external events', 'Check correlation > 0.7',
-                   'Try 2, 8, 13 week windows', 'Compare to competitors', 'Plot sales vs spend trend'],
-    'Red Flag': ['Numbers differ by >10%', 'Major event not modeled', 'Negative coefficients',
-                 'ROI changes by >2x', 'Saturating too early', 'Lines diverging'],
-    'Quick Fix': ['Use platform data', 'Add COVID dummy', 'Combine channels',
-                  'Use 8-week default', 'Test higher spend', 'Add trend line']
-})
+    st.markdown(_PITFALL5_BEGINNER, unsafe_allow_html=True)
 
-st.dataframe(summary_df, use_container_width=True, hide_index=True)
+    col1, col2 = st.columns([1, 1])
 
-st.markdown("""
-<div class="solution-box">
-<h4>🚀 Next Steps:</h4>
-<ol>
-<li><strong>Start with data quality</strong> - it's the foundation</li>
-<li><strong>Check for multicollinearity</strong> - it can flip results completely</li>
-<li><strong>Test different windows and curves</strong> - assumptions matter</li>
-<li><strong>Always include external factors</strong> - context is crucial</li>
-<li><strong>Monitor for drift</strong> - baselines change over time</li>
-</ol>
+    with col1:
+        st.markdown("### 📈 Wrong Saturation = Missed Opportunity")
+    
+        fig = _fig_saturation()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL5_READING, unsafe_allow_html=True)
 
-<strong>Remember:</strong> These pitfalls often occur together. A model with bad data AND wrong saturation AND missing COVID 
-will be completely useless. Fix them one by one!
-</div>
-""", unsafe_allow_html=True)
+    with col2:
+        st.markdown(_PITFALL5_RIGHT_HTML, unsafe_allow_html=True)
+
+# =============================================================================
+# PITFALL 6: BASELINE DRIFT
+# =============================================================================
+
+@st.fragment
+def render_pitfall_6():
+    """Render pitfall 6: Baseline drift"""
+    st.markdown(_section_header("6️⃣", "Baseline Drift", "tricky"), unsafe_allow_html=True)
+
+    st.markdown(_PITFALL6_BEGINNER, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("### 📊 Sales Growing, Marketing Flat - What's Happening?")
+    
+        fig = _fig_baseline_drift()
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+    
+        st.markdown(_PITFALL6_READING, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(_PITFALL6_RIGHT_HTML, unsafe_allow_html=True)
+
+# =============================================================================
+# PAGE LAYOUT
+# =============================================================================
+
+# Header
+st.markdown("# 📊 MMM Common Pitfalls 101: A Beginner's Guide")
+st.markdown(_INTRO_HTML, unsafe_allow_html=True)
+
+# Quick overview
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric("Easy to Understand", "2 Pitfalls", "But tricky to fix")
+with col2:
+    st.metric("Tricky to Understand", "4 Pitfalls", "Need technical knowledge")
+with col3:
+    st.metric("Business Impact", "$1-10M", "Per mistake!")
+
+render_pitfall_1()
+render_pitfall_2()
+
+# The tricky pitfalls sit below the fold, so they start collapsed and the
+# browser only lays out their charts once they are opened
+with st.expander("3️⃣ Multicollinearity - click to expand", expanded=False):
+    render_pitfall_3()
+with st.expander("4️⃣ Attribution Windows (Adstock) - click to expand", expanded=False):
+    render_pitfall_4()
+with st.expander("5️⃣ Saturation Misspecification - click to expand", expanded=False):
+    render_pitfall_5()
+with st.expander("6️⃣ Baseline Drift - click to expand", expanded=False):
+    render_pitfall_6()
 
-# Footer
 st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #666; padding: 2rem;">
-<p><strong>MMM Common Pitfalls 101</strong> | A Beginner's Guide to Marketing Mix Modeling</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+
+# =============================================================================
+# SUMMARY SECTION
+# =============================================================================
+
+@st.fragment
+def render_quick_reference():
+    """Render the quick reference guide and footer"""
+    # Pure HTML with no Markdown in it, so skip the Markdown renderer. st.html
+    # stays in the page DOM; a components.html iframe would lose the page
+    # stylesheet and need a fixed height that clips on narrow screens.
+    st.html(_QUICK_REFERENCE_HTML)
+
+render_quick_reference()
@@ -1,12 +1,10 @@
+import re
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
-from scipy import stats
-from sklearn.preprocessing import StandardScaler
-from sklearn.linear_model import Ridge, Lasso
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,7 +16,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .stTabs [data-baseweb="tab-list"] {
         gap: 24px;
@@ -35,7 +33,1007 @@ st.markdown("""
         margin: 10px 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+# The style block has to be sent on every rerun (elements a rerun does not
+# emit are cleared), so strip indentation once at import
+_CSS = re.sub(r'\s*([{};])\s*', r'\1', re.sub(r'\s+', ' ', _CSS)).strip()
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Synthetic data
+# Every tab draws its series from a fixed seed, so each generator is cached
+# and only run on the first run of the script. The series are float32, which
+# is ample for illustrative charts and halves what Plotly ships to the browser.
+def _weekly_dates(start, periods):
+    """Plain datetime64 array of `periods` weeks from `start`, no DatetimeIndex"""
+    return np.datetime64(start, 'D') + np.arange(periods) * np.timedelta64(7, 'D')
+
+@st.cache_data(show_spinner=False)
+def _gen_tab2_series():
+    """Weekly sales with marketing, COVID, competitor and economy effects"""
+    rng = np.random.default_rng(42)
+    weeks = _weekly_dates('2020-01-05', 104)  # Sundays, as freq='W' gave
+    
+    # Marketing noise and the well-fitted model's residuals in one draw
+    noise_scale = np.array([[10000], [20000]], dtype=np.float32)
+    marketing_noise, residuals_with = rng.standard_normal((2, 104), dtype=np.float32) * noise_scale
+    
+    # Generate synthetic data
+    base_sales = 1000000
+    marketing_effect = np.sin(np.arange(104, dtype=np.float32) * 0.1) * 50000 + marketing_noise
+    # Effects filled into preallocated arrays, without concatenated temporaries
+    covid_effect = np.empty(104, dtype=np.float32)
+    covid_effect[:10] = 0
+    covid_effect[10:30] = -300000
+    covid_effect[30:] = np.linspace(-300000, 0, 74, dtype=np.float32)
+    competitor_effect = np.zeros(104, dtype=np.float32)
+    competitor_effect[31:60] = -100000
+    economy_effect = np.linspace(0, -50000, 104, dtype=np.float32)
+    
+    marketing_only = base_sales + marketing_effect
+    
+    # Residuals: the marketing-only model misses exactly the external effects,
+    # while residuals_with is a simulated good fit
+    residuals_without = covid_effect + competitor_effect
+    residuals_without += economy_effect
+    true_sales = marketing_only + residuals_without
+    return weeks, true_sales, marketing_only, residuals_without, residuals_with
+
+@st.cache_data(show_spinner=False)
+def _gen_tab3_spend():
+    """Weekly TV, radio and digital spend and their correlation matrix"""
+    rng = np.random.default_rng(42)
+    n_weeks = 52
+    
+    # TV spend, radio noise and digital spend in one draw, one channel per
+    # row of a single (3, n_weeks) buffer
+    means = np.array([[100], [0], [50]], dtype=np.float32)
+    sigmas = np.array([[20], [5], [15]], dtype=np.float32)
+    spend = rng.standard_normal((3, n_weeks), dtype=np.float32) * sigmas + means
+    spend[1] += 0.9 * spend[0]  # Radio: high correlation with TV
+    # Digital (row 2) stays independent
+    
+    # Create correlation matrix straight from the stacked rows
+    corr_matrix = np.corrcoef(spend)
+    return spend[0], spend[1], spend[2], corr_matrix
+
+@st.cache_data(show_spinner=False)
+def _gen_tab4_adstock(decay_fast, decay_medium, decay_slow):
+    """Share of the effect remaining in the weeks after a campaign"""
+    weeks = np.arange(0, 13, dtype=np.float32)
+    # One broadcast power over a (3, 13) grid, one row per decay rate
+    decays = np.array([decay_fast, decay_medium, decay_slow], dtype=np.float32)[:, None]
+    adstock_fast, adstock_medium, adstock_slow = 100 * decays ** weeks
+    return weeks, adstock_fast, adstock_medium, adstock_slow
+
+# Hill transformation (S-curve)
+def hill_transform(x, alpha, gamma):
+    x_gamma = x**gamma
+    return alpha * x_gamma / (1 + x_gamma)
+
+# Adbudg transformation
+def adbudg_transform(x, alpha, gamma):
+    return alpha * (1 - np.exp(-gamma * x))
+
+@st.cache_data(show_spinner=False)
+def _gen_tab5_curves():
+    """Wrong and correct saturation curves over monthly spend"""
+    spend = np.linspace(0, 3000, 100, dtype=np.float32)
+    
+    # Wrong curve (too early saturation)
+    wrong_curve = hill_transform(spend/500, 100, 0.8)
+    
+    # Correct curve
+    correct_curve = hill_transform(spend/2000, 100, 1.5)
+    return spend, wrong_curve, correct_curve
+
+@st.cache_data(show_spinner=False)
+def _gen_tab6_drift():
+    """Weekly sales with a growing baseline and flat marketing spend"""
+    rng = np.random.default_rng(42)
+    weeks = _weekly_dates('2023-01-01', 52)
+    
+    # Components
+    baseline_trend = np.linspace(100, 120, 52, dtype=np.float32)  # 20% growth
+    marketing_spend = np.full(52, 100, dtype=np.float32)  # Flat spend
+    marketing_effect = marketing_spend * 0.5 + rng.standard_normal(52, dtype=np.float32) * 5
+    total_sales = baseline_trend + marketing_effect
+    return weeks, baseline_trend, marketing_spend, total_sales
+
+# Display tables
+# Static reference tables, kept as plain dicts and shown with st.table
+# instead of building a DataFrame for an interactive grid.
+
+# Cross-source discrepancy table
+_DISCREPANCY_TABLE = {
+    'Channel': ['Facebook', 'Google', 'TV'],
+    'Max-Min Difference': ['$10K (18%)', '$7K (9%)', '$5K (4%)'],
+    'CV (Coefficient of Variation)': ['8.2%', '4.1%', '2.3%'],
+    'Missing Data Points': ['0', '0', '1 (Agency)']
+}
+
+# Omitted variable bias table
+_BIAS_TABLE = {
+    'Metric': ['Marketing ROI (True)', 'Marketing ROI (Biased)', 'Bias', 'MAPE'],
+    'Without External': ['2.5x', '0.8x', '-68%', '24.3%'],
+    'With External': ['2.5x', '2.4x', '-4%', '3.2%']
+}
+
+# Variance inflation factor table
+_VIF_TABLE = {
+    'Channel': ['TV', 'Radio', 'Digital'],
+    'VIF Score': [12.5, 11.8, 1.3],
+    'Interpretation': ['🔴 Severe', '🔴 Severe', '🟢 No issue']
+}
+
+# Attribution window comparison table
+_WINDOW_COMPARISON_TABLE = {
+    'Window': ['2 weeks', '8 weeks', '13 weeks'],
+    'Revenue Attributed': ['$200K', '$450K', '$480K'],
+    'ROI': ['2.0x', '4.5x', '4.8x'],
+    'Decision': ['Stop campaign', 'Scale up', 'Optimize']
+}
+
+# Saturation business impact table
+_IMPACT_TABLE = {
+    'Spend Level': ['$500K', '$1M', '$2M'],
+    'Wrong Model ROI': ['1.3x', '1.1x', '1.0x'],
+    'Correct Model ROI': ['2.5x', '2.2x', '1.8x'],
+    'Decision (Wrong)': ['Stop here', 'Cut budget', 'Way too much'],
+    'Decision (Correct)': ['Keep going', 'Optimal', 'Near max']
+}
+
+# Trend model comparison table
+_MODEL_COMPARISON_TABLE = {
+    'Model': ['Without Trend', 'With Linear Trend', 'With Spline Trend'],
+    'Marketing ROI': ['5.2x (inflated)', '2.5x (correct)', '2.4x (correct)'],
+    'R²': [0.45, 0.89, 0.92],
+    'MAPE': ['18.5%', '4.2%', '3.8%'],
+    'Baseline Growth': ['Not captured', '1.5% monthly', 'Variable']
+}
+
+# Figures
+# Built from the cached data above, so each figure is also cached and only
+# constructed on the first run of the script. The plain figure dict is cached
+# rather than the mutable Figure object and goes to st.plotly_chart as-is.
+
+def _format_spend(values):
+    """'$55K' style bar labels, with 'Missing' for NaN"""
+    return np.where(np.isnan(values), 'Missing', np.char.mod('$%.0fK', values / 1000))
+
+@st.cache_data(show_spinner=False)
+def _fig_data_sources():
+    """Grouped bar chart of spend reported by each data source"""
+    # Create data discrepancy visualization
+    data_sources = pd.DataFrame({
+        'Source': ['Meta Platform', 'Finance Dept', 'Agency', 'Data Warehouse'],
+        'Facebook Spend': [55000, 50000, 60000, 52500],
+        'Google Spend': [80000, 78000, 85000, 79000],
+        'TV Spend': [120000, 125000, np.nan, 122000]
+    })
+    
+    fig = go.Figure()
+    for col in ['Facebook Spend', 'Google Spend', 'TV Spend']:
+        values = data_sources[col].to_numpy()
+        fig.add_trace(go.Bar(
+            name=col,
+            x=data_sources['Source'],
+            y=values,
+            text=_format_spend(values),
+            textposition='auto',
+        ))
+    
+    fig.update_layout(
+        title="Same Data, Different Numbers Across Sources",
+        xaxis_title="Data Source",
+        yaxis_title="Reported Spend ($)",
+        barmode='group',
+        height=400
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_sales_decomposition():
+    """Actual sales against the marketing-only model"""
+    # Simulate data with and without external factors
+    weeks, true_sales, marketing_only, _, _ = _gen_tab2_series()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=weeks, y=true_sales, name='Actual Sales', 
+                              line=dict(color='black', width=3)))
+    fig.add_trace(go.Scattergl(x=weeks, y=marketing_only, 
+                              name='Marketing Only Model', 
+                              line=dict(color='blue', dash='dash')))
+    
+    fig.update_layout(
+        title="Sales Decomposition with External Factors",
+        yaxis_title="Sales ($)",
+        height=320,
+        showlegend=True
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_residuals():
+    """Model residuals with and without external factors"""
+    weeks, _, _, residuals_without, residuals_with = _gen_tab2_series()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=weeks, y=residuals_without, 
+                              name='Residuals (No External Factors)', 
+                              line=dict(color='red')))
+    fig.add_trace(go.Scattergl(x=weeks, y=residuals_with, 
+                              name='Residuals (With External Factors)', 
+                              line=dict(color='green')))
+    
+    fig.update_layout(
+        title="Model Performance: With vs Without External Factors",
+        xaxis_title="Date",
+        yaxis_title="Residuals ($)",
+        height=320,
+        showlegend=True
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_correlation_heatmap():
+    """Correlation heatmap of TV, radio and digital spend"""
+    # Generate correlated data
+    _, _, _, corr_matrix = _gen_tab3_spend()
+    
+    # Heatmap
+    fig = go.Figure(data=go.Heatmap(
+        z=corr_matrix,
+        x=['TV', 'Radio', 'Digital'],
+        y=['TV', 'Radio', 'Digital'],
+        colorscale='RdBu',
+        zmid=0,
+        text=np.round(corr_matrix, 2),
+        texttemplate='%{text}',
+        textfont={"size": 14},
+        colorbar=dict(title="Correlation")
+    ))
+    fig.update_layout(title="Channel Correlation Matrix", height=400)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_channel_spend():
+    """Weekly TV, radio and digital spend lines"""
+    tv_spend, radio_spend, digital_spend, _ = _gen_tab3_spend()
+    n_weeks = len(tv_spend)
+    
+    # Time series plot
+    weeks = list(range(1, n_weeks + 1))
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=weeks, y=tv_spend, name='TV', line=dict(width=3)))
+    fig.add_trace(go.Scattergl(x=weeks, y=radio_spend, name='Radio', 
+                               line=dict(width=3, dash='dash')))
+    fig.add_trace(go.Scattergl(x=weeks, y=digital_spend, name='Digital', 
+                               line=dict(width=2)))
+    fig.update_layout(
+        title="TV and Radio Move Together (r=0.92)",
+        xaxis_title="Week",
+        yaxis_title="Spend ($K)",
+        height=400
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_adstock_decay():
+    """Adstock decay curves for a fast, medium and slow channel"""
+    # Different decay rates
+    decay_fast = 0.1  # Digital
+    decay_medium = 0.5  # Social
+    decay_slow = 0.8  # TV
+    
+    # Adstock decay visualization
+    weeks, adstock_fast, adstock_medium, adstock_slow = _gen_tab4_adstock(
+        decay_fast, decay_medium, decay_slow)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=weeks, y=adstock_slow, name=f'TV (λ={decay_slow})',
+                              line=dict(width=3), fill='tonexty'))
+    fig.add_trace(go.Scattergl(x=weeks, y=adstock_medium, name=f'Social (λ={decay_medium})',
+                              line=dict(width=3), fill='tonexty'))
+    fig.add_trace(go.Scattergl(x=weeks, y=adstock_fast, name=f'Search (λ={decay_fast})',
+                              line=dict(width=3), fill='tonexty'))
+    
+    fig.update_layout(
+        title="Adstock Decay Patterns by Channel",
+        xaxis_title="Weeks After Campaign",
+        yaxis_title="Remaining Effect (%)",
+        height=400,
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_attribution_roi():
+    """ROI and captured effect by attribution window length"""
+    window_lengths = [1, 2, 4, 8, 13, 26]
+    roi_values = [1.2, 1.8, 2.8, 3.5, 3.8, 3.9]
+    cumulative_capture = [30, 50, 70, 85, 95, 99]
+    
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    fig.add_trace(
+        go.Bar(x=window_lengths, y=roi_values, name="ROI",
+              marker_color='lightblue'),
+        secondary_y=False,
+    )
+    
+    fig.add_trace(
+        go.Scattergl(x=window_lengths, y=cumulative_capture, name="% Effect Captured",
+                    line=dict(color='red', width=3)),
+        secondary_y=True,
+    )
+    
+    fig.update_xaxes(title_text="Attribution Window (Weeks)")
+    fig.update_yaxes(title_text="ROI (x)", secondary_y=False)
+    fig.update_yaxes(title_text="Effect Captured (%)", secondary_y=True)
+    fig.update_layout(title="Same Campaign, Different ROI", height=400)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_saturation():
+    """Wrong vs correct saturation curve with the current spend"""
+    # Generate different saturation curves
+    spend, wrong_curve, correct_curve = _gen_tab5_curves()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=spend, y=wrong_curve, 
+                            name='Wrong Model (Saturates at $500K)',
+                            line=dict(color='red', width=3, dash='dash')))
+    fig.add_trace(go.Scatter(x=spend, y=correct_curve, 
+                            name='Reality (Saturates at $2M)',
+                            line=dict(color='green', width=3)))
+    
+    # Add current spend marker
+    fig.add_trace(go.Scatter(x=[500], y=[65], 
+                            mode='markers',
+                            name='Current Spend',
+                            marker=dict(size=15, color='blue', symbol='star')))
+    
+    fig.update_layout(
+        title="Saturation Misspecification: Missing Growth Opportunity",
+        xaxis_title="Monthly Spend ($K)",
+        yaxis_title="Response (%)",
+        height=400,
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _fig_baseline_drift():
+    """Total sales and hidden baseline against flat marketing spend"""
+    # Generate data with baseline drift
+    weeks, baseline_trend, marketing_spend, total_sales = _gen_tab6_drift()
+    
+    # Create plot
+    fig = go.Figure()
+    
+    # Add traces
+    fig.add_trace(go.Scattergl(x=weeks, y=total_sales, 
+                              name='Total Sales', 
+                              line=dict(color='black', width=3)))
+    fig.add_trace(go.Scattergl(x=weeks, y=baseline_trend, 
+                              name='True Baseline (Hidden)', 
+                              line=dict(color='green', width=2, dash='dash')))
+    fig.add_trace(go.Scattergl(x=weeks, y=marketing_spend, 
+                              name='Marketing Spend (Flat)', 
+                              line=dict(color='red', width=2),
+                              yaxis='y2'))
+    
+    fig.update_layout(
+        title="Sales Growing 20% While Marketing Flat - Who Gets Credit?",
+        xaxis_title="Date",
+        yaxis_title="Sales Index",
+        yaxis2=dict(
+            title="Marketing Spend Index",
+            overlaying='y',
+            side='right'
+        ),
+        height=400,
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+# Reference text
+# Markdown and code snippets shown in the tabs, kept as module constants.
+_MD_TAB1_VALIDATION = """
+**1. Data Validation Pipeline**
+```python
+# Automated validation checks
+def validate_data(df):
+    checks = {
+        'duplicates': df.duplicated().sum(),
+        'missing': df.isnull().sum(),
+        'outliers': detect_outliers(df),
+        'date_gaps': find_date_gaps(df),
+        'negative_values': (df < 0).sum()
+    }
+    return checks
+```
+"""
+
+_MD_TAB1_RECONCILIATION = """
+**2. Statistical Reconciliation Methods:**
+- **Dempster-Shafer Theory**: Combine evidence from multiple sources
+- **Kalman Filtering**: Optimal estimation from noisy sources
+- **Robust PCA**: Identify and correct systematic biases
+"""
+
+_MD_TAB1_PRIORITY = """
+**3. Source Priority Matrix:**
+| Priority | Source Type | Use Case |
+|----------|------------|----------|
+| 1 | Platform APIs | Ground truth |
+| 2 | Data Warehouse | Consolidated |
+| 3 | Finance Systems | Invoice-based |
+| 4 | Agency Reports | Reference only |
+"""
+
+# Consecutive blocks of a column go out as a single markdown element
+_MD_TAB1_SOLUTIONS = _MD_TAB1_VALIDATION + _MD_TAB1_RECONCILIATION + _MD_TAB1_PRIORITY
+
+_MD_TAB2_RESET = """
+**1. Ramsey RESET Test for Omitted Variables**
+```python
+from statsmodels.stats.diagnostic import linear_reset
+
+# Test for omitted variables
+reset_test = linear_reset(model, power=3)
+p_value = reset_test.pvalue
+
+if p_value < 0.05:
+    print("Evidence of omitted variables")
+```
+"""
+
+_MD_TAB2_FACTORS = """
+**2. External Factors to Include:**
+
+| Factor | Data Source | Transformation |
+|--------|-------------|----------------|
+| COVID-19 | Google Mobility | Log transform |
+| Competition | SEMrush/Similar | Market share % |
+| Economy | FRED API | First difference |
+| Weather | NOAA API | Rolling average |
+| Seasonality | Prophet | Fourier terms |
+| Holidays | Custom calendar | Binary dummies |
+"""
+
+_MD_TAB2_CAUSAL = """
+**3. Causal Inference Methods:**
+- **Instrumental Variables (IV)**: 2SLS estimation
+- **Regression Discontinuity**: Sharp cutoff events
+- **Synthetic Control**: Create counterfactual
+- **Double ML**: Machine learning + causality
+"""
+
+# Consecutive blocks of a column go out as a single markdown element
+_MD_TAB2_SOLUTIONS = _MD_TAB2_RESET + _MD_TAB2_FACTORS + _MD_TAB2_CAUSAL
+
+_MD_TAB3_DETECTION = """
+**1. Detection Methods:**
+```python
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+# Calculate VIF
+def calculate_vif(df):
+    vif = pd.DataFrame()
+    vif["Variable"] = df.columns
+    vif["VIF"] = [variance_inflation_factor(df.values, i) 
+                  for i in range(df.shape[1])]
+    return vif
+
+# Condition Number
+condition_number = np.linalg.cond(X)
+# > 30 indicates multicollinearity
+```
+"""
+
+_MD_TAB3_RIDGE_LASSO = """
+**Ridge Regression (L2 Regularization)**
+```python
+from sklearn.linear_model import RidgeCV
+
+alphas = np.logspace(-6, 6, 13)
+ridge = RidgeCV(alphas=alphas, cv=5)
+ridge.fit(X, y)
+
+# Optimal alpha: 0.1
+# Reduces coefficient variance
+```
+
+**LASSO (L1 Regularization)**
+```python
+from sklearn.linear_model import LassoCV
+
+lasso = LassoCV(cv=5, random_state=42)
+lasso.fit(X, y)
+
+# Can set coefficients to zero
+# Automatic feature selection
+```
+"""
+
+_MD_TAB3_PCA = """
+**Principal Component Analysis**
+```python
+from sklearn.decomposition import PCA
+
+pca = PCA(n_components=0.95)  # Keep 95% variance
+X_pca = pca.fit_transform(X)
+
+# Transform back for interpretation
+coefficients = pca.inverse_transform(
+    model.coef_
+)
+```
+
+**Partial Least Squares**
+```python
+from sklearn.cross_decomposition import PLSRegression
+
+pls = PLSRegression(n_components=2)
+pls.fit(X, y)
+```
+"""
+
+_MD_TAB3_OTHER = """
+**Other Advanced Methods:**
+
+1. **Elastic Net** (Ridge + LASSO)
+2. **Orthogonalization** (Gram-Schmidt)
+3. **Variable Clustering** (merge similar)
+4. **Instrumental Variables** (2SLS)
+5. **Bayesian Priors** (informative priors)
+6. **Time-varying Parameters** (DLM)
+"""
+
+_MD_TAB4_ADSTOCK = """
+**1. Adstock Transformations:**
+"""
+
+_MD_TAB4_GEO = """
+**Geometric Adstock** (Most Common)
+```python
+from scipy.signal import lfilter
+
+def geometric_adstock(x, theta):
+    # y[t] = x[t] + theta * y[t-1] is a one-pole IIR filter,
+    # so run the recursion in compiled code instead of a loop
+    return lfilter([1.0], [1.0, -float(theta)], x)
+
+# Theta (decay rate): 0-1
+# Half-life = -ln(2) / ln(theta)
+```
+
+**Parameters:**
+- TV: θ = 0.4-0.7
+- Radio: θ = 0.3-0.6  
+- Digital: θ = 0.0-0.3
+- OOH: θ = 0.2-0.5
+"""
+
+_MD_TAB4_WEIBULL = """
+**Weibull Adstock** (Flexible Shape)
+```python
+from scipy.signal import fftconvolve
+
+def weibull_adstock(x, shape, scale):
+    n = len(x)
+    # The window is one vectorized expression with no Python loop, so
+    # compiling it (e.g. with Numba) would not make it faster
+    lags = np.arange(n) / scale
+    convolve_window = (shape/scale) * lags**(shape-1) * np.exp(-lags**shape)
+    convolve_window = convolve_window / convolve_window.sum()
+    # FFT convolution: O(n log n) instead of O(n^2)
+    return fftconvolve(x, convolve_window)[:n]
+
+# Shape < 1: L-shaped decay
+# Shape > 1: Peak then decay
+```
+"""
+
+_MD_TAB4_DELAYED = """
+**Delayed Adstock** (Peak Delay)
+```python
+def delayed_adstock(x, theta, delay):
+    x_delayed = np.zeros_like(x)
+    x_delayed[delay:] = x[:-delay]
+    return geometric_adstock(x_delayed, theta)
+
+# Delay: 1-3 weeks typical
+# Good for: TV, OOH
+```
+"""
+
+_MD_TAB4_SELECTION = """
+**2. Selection Methods:**
+
+| Method | Description | Pros | Cons |
+|--------|-------------|------|------|
+| Grid Search | Test multiple θ values | Simple | Computationally expensive |
+| AIC/BIC | Information criteria | Balances fit & complexity | May overfit |
+| Cross-validation | Out-of-sample testing | Robust | Requires lots of data |
+| Business knowledge | Use campaign duration | Practical | May be biased |
+| Experiments | Measure actual decay | Ground truth | Expensive |
+"""
+
+_MD_TAB5_HILL = """
+**Hill Saturation (S-Curve)**
+```python
+def hill_saturation(x, alpha, gamma):
+    # alpha: maximum effect
+    # gamma: shape parameter
+    return alpha * (x**gamma) / (1 + x**gamma)
+
+# gamma < 1: Concave (diminishing returns)
+# gamma = 1: Michaelis-Menten
+# gamma > 1: S-shaped (slow start)
+```
+
+**When to use:**
+- TV, Radio, OOH (brand building)
+- Channels with threshold effects
+- Long purchase cycles
+"""
+
+_MD_TAB5_ADBUDG = """
+**Adbudg Saturation**
+```python
+def adbudg_saturation(x, alpha, gamma):
+    # alpha: maximum effect
+    # gamma: rate of saturation
+    return alpha * (1 - np.exp(-gamma * x))
+
+# Higher gamma = faster saturation
+```
+
+**When to use:**
+- Digital channels
+- Direct response
+- Quick saturation expected
+"""
+
+_MD_TAB5_MICHAELIS = """
+**Michaelis-Menten**
+```python
+def michaelis_menten(x, vmax, km):
+    # vmax: maximum response
+    # km: half-saturation constant
+    return (vmax * x) / (km + x)
+
+# km = spend at 50% of max effect
+```
+
+**When to use:**
+- Simple, interpretable
+- One parameter for saturation point
+- Good default choice
+"""
+
+_MD_TAB5_SELECTION = """
+**3. Model Selection Framework:**
+
+```python
+from scipy.optimize import curve_fit
+import numpy as np
+
+# Test multiple saturations
+saturations = {
+    'linear': lambda x, a: a * x,
+    'sqrt': lambda x, a: a * np.sqrt(x),
+    'log': lambda x, a: a * np.log1p(x),
+    'hill': lambda x, a, g: hill_saturation(x, a, g),
+    'adbudg': lambda x, a, g: adbudg_saturation(x, a, g)
+}
+
+# Fit each and compare AIC
+best_aic = np.inf
+best_model = None
+
+for name, func in saturations.items():
+    params, _ = curve_fit(func, X, y)
+    predictions = func(X, *params)
+    aic = calculate_aic(y, predictions, len(params))
+
+    if aic < best_aic:
+        best_aic = aic
+        best_model = name
+```
+"""
+
+_MD_TAB6_TESTS = """
+**1. Statistical Tests for Drift:**
+"""
+
+_MD_TAB6_CHOW = """
+**Chow Test for Structural Break**
+```python
+from functools import lru_cache
+from scipy import stats
+
+@lru_cache(maxsize=128)
+def _chow_const(n, k):
+    # 5% critical value and residual dof depend only on the data shape,
+    # which stays fixed across model refreshes
+    dof = n - 2*k
+    return stats.f.ppf(0.95, k, dof), dof
+
+def residual_ss(X, y):
+    # RSS = ||y||² - ||Qᵀy||² from a thin QR of X, without fitting a
+    # model object or building the residual vector
+    Q = np.linalg.qr(X)[0]
+    Qty = Q.T @ y
+    return y @ y - Qty @ Qty
+
+def _chow_f(RSS_pooled, RSS_split, n, k):
+    # F-statistic, p-value and 5% decision from pooled and split RSS
+    crit, dof = _chow_const(n, k)
+    F = ((RSS_pooled - RSS_split) / k) / (RSS_split / dof)
+
+    # Upper tail directly: 1 - cdf rounds small p-values to 0
+    return F, stats.f.sf(F, k, dof), F > crit
+
+def chow_test(y, X, break_point):
+    X1, y1 = X[:break_point], y[:break_point]
+    X2, y2 = X[break_point:], y[break_point:]
+
+    # Residual sums of squares: pooled and per segment
+    RSS_pooled = residual_ss(X, y)
+    RSS_1 = residual_ss(X1, y1)
+    RSS_2 = residual_ss(X2, y2)
+    return _chow_f(RSS_pooled, RSS_1 + RSS_2, *X.shape)
+
+def _running_sums(y, X):
+    # Running XᵀX, Xᵀy and yᵀy: each segment's normal equations come from
+    # a subtraction, so every candidate break costs a k×k solve, not a refit
+    XtX = np.cumsum(np.einsum('ti,tj->tij', X, X), axis=0)
+    Xty = np.cumsum(X * y[:, None], axis=0)
+    yty = np.cumsum(y * y)
+    return XtX, Xty, yty
+
+def _fit(G, b, c):
+    # Coefficients and RSS from normal equations, batched over leading axes
+    beta = np.linalg.solve(G, b[..., None])[..., 0]
+    return beta, c - np.einsum('...i,...i', b, beta)
+
+def _split_rss(sums, break_points):
+    # RSS of the two-segment model for every candidate break at once
+    XtX, Xty, yty = sums
+    last = np.asarray(break_points) - 1
+    RSS_1 = _fit(XtX[last], Xty[last], yty[last])[1]
+    RSS_2 = _fit(XtX[-1] - XtX[last], Xty[-1] - Xty[last], yty[-1] - yty[last])[1]
+    return RSS_1 + RSS_2
+
+def chow_test_grid(y, X, break_points):
+    sums = _running_sums(y, X)
+    XtX, Xty, yty = sums
+    RSS_pooled = _fit(XtX[-1], Xty[-1], yty[-1])[1]
+    return _chow_f(RSS_pooled, _split_rss(sums, break_points), *X.shape)
+```
+"""
+
+_MD_TAB6_CUSUM = """
+**CUSUM Test**
+```python
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+def _cusum_bound(n):
+    # 5% boundary for a series of length n
+    return 0.948 * np.sqrt(n)
+
+def _cumulative_stats(r):
+    # Running sum, mean, sample variance and sd from two cumulative sums,
+    # shared by the CUSUM and any rolling drift diagnostics
+    idx = np.arange(1, len(r) + 1)
+    cs = np.cumsum(r)
+    cm = cs / idx
+    cvar = (np.cumsum(r * r) - cs * cm) / np.maximum(idx - 1, 1)
+    return cs, cm, cvar, np.sqrt(cvar)
+
+def cusum_test(residuals):
+    n = len(residuals)
+    cs, _, _, sd = _cumulative_stats(residuals)
+    cusum = cs / sd[-1]
+
+    # Critical bounds (5% significance)
+    bounds = _cusum_bound(n) * np.array([1, -1])
+
+    # First week the CUSUM leaves the bounds (-1 if it never does)
+    outside = np.abs(cusum) > bounds[0]
+    first = np.argmax(outside)
+    drift_detected = bool(outside[first])
+    break_idx = first if drift_detected else -1
+    return cusum, bounds, drift_detected, break_idx
+```
+
+**Long series:** Numba reads the residuals once, keeping the running sum
+and sum of squares in registers, then scales and scans for the first
+crossing in the same compiled loop.
+```python
+from numba import njit
+
+@njit(fastmath=True, cache=True)
+def cusum_single_pass(r, bound):
+    n = len(r)
+    cusum = np.empty(n)
+    s, sq = 0.0, 0.0
+    for t in range(n):
+        s += r[t]
+        sq += r[t] * r[t]
+        cusum[t] = s
+    sd = np.sqrt((sq - s * s / n) / (n - 1))
+    break_idx = -1
+    for t in range(n):
+        cusum[t] /= sd
+        if break_idx < 0 and abs(cusum[t]) > bound:
+            break_idx = t
+    return cusum, break_idx
+
+cusum, break_idx = cusum_single_pass(residuals, _cusum_bound(len(residuals)))
+```
+
+**Interpretation:**
+- Within bounds: No drift
+- Exceeds bounds: Parameter instability, starting at `break_idx`
+"""
+
+_MD_TAB6_KALMAN = """
+**Kalman Filter (Time-Varying Parameters)**
+```python
+from simdkalman.primitives import predict, update
+
+# State space model: local level plus slope, level observed with noise
+A = np.array([[1, 1], [0, 1]], dtype=np.float32)
+H = np.array([[1, 0]], dtype=np.float32)
+Q = 0.01 * np.eye(2, dtype=np.float32)
+R = np.eye(1, dtype=np.float32)
+
+# sales_matrix: one contiguous float32 buffer, one row per series
+# (geo, brand, ...) and one column per week, rather than a list of frames
+sales_matrix = np.ascontiguousarray(sales_matrix, dtype=np.float32)
+N, T = sales_matrix.shape
+y = sales_matrix[:, :, None, None]
+
+m = np.stack([sales_matrix[:, 0], np.zeros(N, np.float32)], axis=1)[:, :, None]
+P = np.tile(np.eye(2, dtype=np.float32), (N, 1, 1))
+
+# Estimate time-varying baselines, every series in one batched step
+baseline = np.empty((N, T), np.float32)
+trend = np.empty((N, T), np.float32)
+for t in range(T):
+    if t > 0:
+        m, P = predict(m, P, A, Q)
+    m, P = update(m, P, H, R, y[:, t])
+    baseline[:, t] = m[:, 0, 0]
+    trend[:, t] = m[:, 1, 0]
+```
+
+**Single series:** FilterPy's `KalmanFilter` runs the same model with
+`predict`/`update` on preallocated arrays.
+```python
+from filterpy.kalman import KalmanFilter
+
+kf = KalmanFilter(dim_x=2, dim_z=1)
+kf.F = np.array([[1., 1.], [0., 1.]])
+kf.H = np.array([[1., 0.]])
+kf.Q = 0.01 * np.eye(2)
+kf.R = 1.0
+kf.x = np.array([sales[0], 0.])
+kf.P = np.eye(2)
+
+baseline = np.empty(len(sales))
+for i, z in enumerate(sales):
+    if i > 0:
+        kf.predict()
+    kf.update(z)
+    baseline[i] = kf.x[0]
+```
+
+**Structural fast path:** because `H = [1, 0]`, the innovation variance
+`S = P[0,0] + R` is a scalar and the gain is `K = P[:,0] / S`, so no
+matrix inverse is needed. Because `F = [[1, 1], [0, 1]]`, the predict step is
+three additions. The same unrolling applies to the local-level and
+damped-trend specs commonly used for baseline drift.
+```python
+from numba import njit
+
+@njit(fastmath=True, cache=True)
+def llt_filter(y, q_level=0.01, q_slope=0.01, r_obs=1.0):
+    n = len(y)
+    baseline = np.empty(n)
+    trend = np.empty(n)
+    level, slope = y[0], 0.0
+    P00, P01, P11 = 1.0, 0.0, 1.0
+    for t in range(n):
+        if t > 0:
+            # Predict: F P Fᵀ + Q written out for F = [[1, 1], [0, 1]]
+            level += slope
+            P00 += 2 * P01 + P11 + q_level
+            P01 += P11
+            P11 += q_slope
+        # Update: H = [1, 0] makes S a scalar and K = P[:, 0] / S
+        v = y[t] - level
+        S = P00 + r_obs
+        K0, K1 = P00 / S, P01 / S
+        level += K0 * v
+        slope += K1 * v
+        # P -= outer(K, P[0, :]), ordered so P01 is read before it changes
+        P11 -= K1 * P01
+        P01 -= K0 * P01
+        P00 -= K0 * P00
+        baseline[t] = level
+        trend[t] = slope
+    return baseline, trend
+```
+"""
+
+_MD_TAB6_TRENDS = """
+**2. Trend Specifications:**
+
+| Type | Formula | Use Case |
+|------|---------|----------|
+| Linear | β₀ + β₁t | Steady growth |
+| Quadratic | β₀ + β₁t + β₂t² | Acceleration |
+| Log | β₀ + β₁ln(t) | Slowing growth |
+| Spline | Σβᵢ·basis_i(t) | Flexible |
+| Prophet | g(t) + s(t) + h(t) | Complex patterns |
+"""
+
+_MD_TAB6_PIPELINE = """
+**All checks from shared running sums:** the running XᵀX, Xᵀy and yᵀy
+are built once. The pooled fit, its residuals for the CUSUM, the split
+RSS for every candidate break and both AICs all come from them, reusing
+the helpers above.
+```python
+def diagnose_drift(y, X, break_candidates):
+    n, k = X.shape
+    sums = _running_sums(y, X)
+    XtX, Xty, yty = sums
+
+    # Pooled fit: coefficients and RSS from the full-sample sums
+    beta, rss_pooled = _fit(XtX[-1], Xty[-1], yty[-1])
+    r = y - X @ beta
+
+    # CUSUM of the pooled residuals
+    cs, _, _, sd = _cumulative_stats(r)
+    cusum = cs / sd[-1]
+    outside = np.abs(cusum) > _cusum_bound(n)
+
+    # Chow test for every candidate break from the same sums
+    rss_split = _split_rss(sums, break_candidates)
+    F, p_value, is_break = _chow_f(rss_pooled, rss_split, n, k)
+
+    return {
+        'cusum': cusum,
+        'cusum_break': np.argmax(outside) if outside.any() else -1,
+        'chow_F': F,
+        'chow_p': p_value,
+        'chow_break': is_break,
+        'aic_pooled': n * np.log(rss_pooled / n) + 2*k,
+        'aic_split': n * np.log(rss_split / n) + 4*k,
+    }
+```
+"""
+
+_MD_TAKEAWAYS = """
+### 📚 Key Takeaways
+
+| Pitfall | Detection | Primary Solution | Validation |
+|---------|-----------|-----------------|------------|
+| Data Quality | Compare sources | Use platform data | Correlation > 0.95 |
+| External Factors | RESET test | Include confounders | Check residuals |
+| Multicollinearity | VIF > 10 | Ridge regression | Cross-validation |
+| Attribution Windows | Compare windows | Grid search decay | Business knowledge |
+| Saturation | Compare curves | Test multiple forms | Competitor benchmarks |
+| Baseline Drift | CUSUM test | Add trend terms | Holdout test |
+
+**Remember:** These pitfalls often occur together. Always check for all six in your MMM projects!
+"""
 
 # Title
 st.title("🎯 6 Common MMM Pitfalls: Technical Deep Dive")
@@ -75,78 +1073,16 @@ with tab1:
     with col1:
         st.subheader("📊 The Problem: Multiple Data Sources")
         
-        # Create data discrepancy visualization
-        data_sources = pd.DataFrame({
-            'Source': ['Meta Platform', 'Finance Dept', 'Agency', 'Data Warehouse'],
-            'Facebook Spend': [55000, 50000, 60000, 52500],
-            'Google Spend': [80000, 78000, 85000, 79000],
-            'TV Spend': [120000, 125000, np.nan, 122000]
-        })
-        
-        fig = go.Figure()
-        for col in ['Facebook Spend', 'Google Spend', 'TV Spend']:
-            fig.add_trace(go.Bar(
-                name=col,
-                x=data_sources['Source'],
-                y=data_sources[col],
-                text=data_sources[col].apply(lambda x: f'${x/1000:.0f}K' if pd.notna(x) else 'Missing'),
-                textposition='auto',
-            ))
-        
-        fig.update_layout(
-            title="Same Data, Different Numbers Across Sources",
-            xaxis_title="Data Source",
-            yaxis_title="Reported Spend ($)",
-            barmode='group',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_data_sources(), use_container_width=True)
         
         # Show discrepancy metrics
         st.markdown("### 🔍 Discrepancy Analysis")
-        discrepancy_df = pd.DataFrame({
-            'Channel': ['Facebook', 'Google', 'TV'],
-            'Max-Min Difference': ['$10K (18%)', '$7K (9%)', '$5K (4%)'],
-            'CV (Coefficient of Variation)': ['8.2%', '4.1%', '2.3%'],
-            'Missing Data Points': ['0', '0', '1 (Agency)']
-        })
-        st.dataframe(discrepancy_df, use_container_width=True)
+        st.table(_DISCREPANCY_TABLE)
     
     with col2:
         st.subheader("🛠️ Technical Solutions")
         
-        st.markdown("""
-        **1. Data Validation Pipeline**
-        ```python
-        # Automated validation checks
-        def validate_data(df):
-            checks = {
-                'duplicates': df.duplicated().sum(),
-                'missing': df.isnull().sum(),
-                'outliers': detect_outliers(df),
-                'date_gaps': find_date_gaps(df),
-                'negative_values': (df < 0).sum()
-            }
-            return checks
-        ```
-        """)
-        
-        st.markdown("""
-        **2. Statistical Reconciliation Methods:**
-        - **Dempster-Shafer Theory**: Combine evidence from multiple sources
-        - **Kalman Filtering**: Optimal estimation from noisy sources
-        - **Robust PCA**: Identify and correct systematic biases
-        """)
-        
-        st.markdown("""
-        **3. Source Priority Matrix:**
-        | Priority | Source Type | Use Case |
-        |----------|------------|----------|
-        | 1 | Platform APIs | Ground truth |
-        | 2 | Data Warehouse | Consolidated |
-        | 3 | Finance Systems | Invoice-based |
-        | 4 | Agency Reports | Reference only |
-        """)
+        st.markdown(_MD_TAB1_SOLUTIONS)
         
         st.info("""
         **📈 Best Practice Algorithm:**
@@ -167,97 +1103,17 @@ with tab2:
     with col1:
         st.subheader("📉 Impact of Omitted Variables")
         
-        # Simulate data with and without external factors
-        np.random.seed(42)
-        weeks = pd.date_range('2020-01-01', periods=104, freq='W')
-        
-        # Generate synthetic data
-        base_sales = 1000000
-        marketing_effect = np.sin(np.arange(104) * 0.1) * 50000 + np.random.normal(0, 10000, 104)
-        covid_effect = np.concatenate([np.zeros(10), 
-                                      -np.ones(20) * 300000,
-                                      np.linspace(-300000, 0, 74)])
-        competitor_effect = np.where((np.arange(104) > 30) & (np.arange(104) < 60), -100000, 0)
-        economy_effect = np.linspace(0, -50000, 104)
-        
-        true_sales = base_sales + marketing_effect + covid_effect + competitor_effect + economy_effect
-        
-        # Create plot
-        fig = make_subplots(rows=2, cols=1, 
-                           subplot_titles=("Sales Decomposition with External Factors",
-                                         "Model Performance: With vs Without External Factors"))
-        
-        # Top plot - decomposition
-        fig.add_trace(go.Scatter(x=weeks, y=true_sales, name='Actual Sales', 
-                                line=dict(color='black', width=3)), row=1, col=1)
-        fig.add_trace(go.Scatter(x=weeks, y=base_sales + marketing_effect, 
-                                name='Marketing Only Model', 
-                                line=dict(color='blue', dash='dash')), row=1, col=1)
-        
-        # Bottom plot - residuals
-        residuals_without = true_sales - (base_sales + marketing_effect)
-        residuals_with = np.random.normal(0, 20000, 104)  # Simulated good fit
-        
-        fig.add_trace(go.Scatter(x=weeks, y=residuals_without, 
-                                name='Residuals (No External Factors)', 
-                                line=dict(color='red')), row=2, col=1)
-        fig.add_trace(go.Scatter(x=weeks, y=residuals_with, 
-                                name='Residuals (With External Factors)', 
-                                line=dict(color='green')), row=2, col=1)
-        
-        fig.update_layout(height=600, showlegend=True)
-        fig.update_xaxes(title_text="Date", row=2, col=1)
-        fig.update_yaxes(title_text="Sales ($)", row=1, col=1)
-        fig.update_yaxes(title_text="Residuals ($)", row=2, col=1)
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_sales_decomposition(), use_container_width=True)
+        st.plotly_chart(_fig_residuals(), use_container_width=True)
         
         # Show bias metrics
         st.markdown("### 📊 Omitted Variable Bias")
-        bias_df = pd.DataFrame({
-            'Metric': ['Marketing ROI (True)', 'Marketing ROI (Biased)', 'Bias', 'MAPE'],
-            'Without External': ['2.5x', '0.8x', '-68%', '24.3%'],
-            'With External': ['2.5x', '2.4x', '-4%', '3.2%']
-        })
-        st.dataframe(bias_df, use_container_width=True)
+        st.table(_BIAS_TABLE)
     
     with col2:
         st.subheader("🔬 Technical Detection & Solutions")
         
-        st.markdown("""
-        **1. Ramsey RESET Test for Omitted Variables**
-        ```python
-        from statsmodels.stats.diagnostic import linear_reset
-        
-        # Test for omitted variables
-        reset_test = linear_reset(model, power=3)
-        p_value = reset_test.pvalue
-        
-        if p_value < 0.05:
-            print("Evidence of omitted variables")
-        ```
-        """)
-        
-        st.markdown("""
-        **2. External Factors to Include:**
-        
-        | Factor | Data Source | Transformation |
-        |--------|-------------|----------------|
-        | COVID-19 | Google Mobility | Log transform |
-        | Competition | SEMrush/Similar | Market share % |
-        | Economy | FRED API | First difference |
-        | Weather | NOAA API | Rolling average |
-        | Seasonality | Prophet | Fourier terms |
-        | Holidays | Custom calendar | Binary dummies |
-        """)
-        
-        st.markdown("""
-        **3. Causal Inference Methods:**
-        - **Instrumental Variables (IV)**: 2SLS estimation
-        - **Regression Discontinuity**: Sharp cutoff events
-        - **Synthetic Control**: Create counterfactual
-        - **Double ML**: Machine learning + causality
-        """)
+        st.markdown(_MD_TAB2_SOLUTIONS)
         
         st.success("""
         **🎯 Implementation Framework:**
@@ -278,55 +1134,13 @@ with tab3:
     with col1:
         st.subheader("🔗 The Problem: Correlated Channels")
         
-        # Generate correlated data
-        np.random.seed(42)
-        n_weeks = 52
-        tv_spend = np.random.normal(100, 20, n_weeks)
-        radio_spend = 0.9 * tv_spend + np.random.normal(0, 5, n_weeks)  # High correlation
-        digital_spend = np.random.normal(50, 15, n_weeks)  # Independent
-        
-        # Create correlation matrix
-        corr_matrix = np.corrcoef([tv_spend, radio_spend, digital_spend])
-        
-        # Heatmap
-        fig1 = go.Figure(data=go.Heatmap(
-            z=corr_matrix,
-            x=['TV', 'Radio', 'Digital'],
-            y=['TV', 'Radio', 'Digital'],
-            colorscale='RdBu',
-            zmid=0,
-            text=np.round(corr_matrix, 2),
-            texttemplate='%{text}',
-            textfont={"size": 14},
-            colorbar=dict(title="Correlation")
-        ))
-        fig1.update_layout(title="Channel Correlation Matrix", height=400)
-        st.plotly_chart(fig1, use_container_width=True)
-        
-        # Time series plot
-        weeks = list(range(1, n_weeks + 1))
-        fig2 = go.Figure()
-        fig2.add_trace(go.Scatter(x=weeks, y=tv_spend, name='TV', line=dict(width=3)))
-        fig2.add_trace(go.Scatter(x=weeks, y=radio_spend, name='Radio', 
-                                 line=dict(width=3, dash='dash')))
-        fig2.add_trace(go.Scatter(x=weeks, y=digital_spend, name='Digital', 
-                                 line=dict(width=2)))
-        fig2.update_layout(
-            title="TV and Radio Move Together (r=0.92)",
-            xaxis_title="Week",
-            yaxis_title="Spend ($K)",
-            height=400
-        )
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(_fig_correlation_heatmap(), use_container_width=True)
+        
+        st.plotly_chart(_fig_channel_spend(), use_container_width=True)
         
         # VIF Calculation
         st.markdown("### 📈 Variance Inflation Factor (VIF)")
-        vif_df = pd.DataFrame({
-            'Channel': ['TV', 'Radio', 'Digital'],
-            'VIF Score': [12.5, 11.8, 1.3],
-            'Interpretation': ['🔴 Severe', '🔴 Severe', '🟢 No issue']
-        })
-        st.dataframe(vif_df, use_container_width=True)
+        st.table(_VIF_TABLE)
         
         st.warning("""
         **Impact of Multicollinearity:**
@@ -339,88 +1153,18 @@ with tab3:
     with col2:
         st.subheader("🛠️ Advanced Solutions")
         
-        st.markdown("""
-        **1. Detection Methods:**
-        ```python
-        from statsmodels.stats.outliers_influence import variance_inflation_factor
-        
-        # Calculate VIF
-        def calculate_vif(df):
-            vif = pd.DataFrame()
-    vif["Variable"] = df.columns
-    vif["VIF"] = [variance_inflation_factor(df.values, i) 
-                  for i in range(df.shape[1])]
-    return vif
-        
-        # Condition Number
-        condition_number = np.linalg.cond(X)
-        # > 30 indicates multicollinearity
-        ```
-        """)
+        st.markdown(_MD_TAB3_DETECTION)
         
         tab_sol1, tab_sol2, tab_sol3 = st.tabs(["Ridge/LASSO", "PCA", "Other Methods"])
         
         with tab_sol1:
-            st.markdown("""
-            **Ridge Regression (L2 Regularization)**
-            ```python
-            from sklearn.linear_model import RidgeCV
-            
-            alphas = np.logspace(-6, 6, 13)
-            ridge = RidgeCV(alphas=alphas, cv=5)
-            ridge.fit(X, y)
-            
-            # Optimal alpha: 0.1
-            # Reduces coefficient variance
-            ```
-            
-            **LASSO (L1 Regularization)**
-            ```python
-            from sklearn.linear_model import LassoCV
-            
-            lasso = LassoCV(cv=5, random_state=42)
-            lasso.fit(X, y)
-            
-            # Can set coefficients to zero
-            # Automatic feature selection
-            ```
-            """)
+            st.markdown(_MD_TAB3_RIDGE_LASSO)
         
         with tab_sol2:
-            st.markdown("""
-            **Principal Component Analysis**
-            ```python
-            from sklearn.decomposition import PCA
-            
-            pca = PCA(n_components=0.95)  # Keep 95% variance
-            X_pca = pca.fit_transform(X)
-            
-            # Transform back for interpretation
-            coefficients = pca.inverse_transform(
-                model.coef_
-            )
-            ```
-            
-            **Partial Least Squares**
-            ```python
-            from sklearn.cross_decomposition import PLSRegression
-            
-            pls = PLSRegression(n_components=2)
-            pls.fit(X, y)
-            ```
-            """)
+            st.markdown(_MD_TAB3_PCA)
         
         with tab_sol3:
-            st.markdown("""
-            **Other Advanced Methods:**
-            
-            1. **Elastic Net** (Ridge + LASSO)
-            2. **Orthogonalization** (Gram-Schmidt)
-            3. **Variable Clustering** (merge similar)
-            4. **Instrumental Variables** (2SLS)
-            5. **Bayesian Priors** (informative priors)
-            6. **Time-varying Parameters** (DLM)
-            """)
+            st.markdown(_MD_TAB3_OTHER)
         
         st.info("""
         **📊 Recommended Approach:**
@@ -441,145 +1185,33 @@ with tab4:
     with col1:
         st.subheader("⏱️ The Problem: How Long Do Effects Last?")
         
-        # Adstock decay visualization
-        weeks = np.arange(0, 13)
-        
-        # Different decay rates
-        decay_fast = 0.1  # Digital
-        decay_medium = 0.5  # Social
-        decay_slow = 0.8  # TV
-        
-        adstock_fast = 100 * (decay_fast ** weeks)
-        adstock_medium = 100 * (decay_medium ** weeks)
-        adstock_slow = 100 * (decay_slow ** weeks)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=weeks, y=adstock_slow, name=f'TV (λ={decay_slow})',
-                                line=dict(width=3), fill='tonexty'))
-        fig.add_trace(go.Scatter(x=weeks, y=adstock_medium, name=f'Social (λ={decay_medium})',
-                                line=dict(width=3), fill='tonexty'))
-        fig.add_trace(go.Scatter(x=weeks, y=adstock_fast, name=f'Search (λ={decay_fast})',
-                                line=dict(width=3), fill='tonexty'))
-        
-        fig.update_layout(
-            title="Adstock Decay Patterns by Channel",
-            xaxis_title="Weeks After Campaign",
-            yaxis_title="Remaining Effect (%)",
-            height=400,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_adstock_decay(), use_container_width=True)
         
         # ROI by window length
         st.markdown("### 📊 ROI Changes with Attribution Window")
         
-        window_lengths = [1, 2, 4, 8, 13, 26]
-        roi_values = [1.2, 1.8, 2.8, 3.5, 3.8, 3.9]
-        cumulative_capture = [30, 50, 70, 85, 95, 99]
-        
-        fig2 = make_subplots(specs=[[{"secondary_y": True}]])
-        
-        fig2.add_trace(
-            go.Bar(x=window_lengths, y=roi_values, name="ROI",
-                  marker_color='lightblue'),
-            secondary_y=False,
-        )
-        
-        fig2.add_trace(
-            go.Scatter(x=window_lengths, y=cumulative_capture, name="% Effect Captured",
-                      line=dict(color='red', width=3)),
-            secondary_y=True,
-        )
-        
-        fig2.update_xaxes(title_text="Attribution Window (Weeks)")
-        fig2.update_yaxes(title_text="ROI (x)", secondary_y=False)
-        fig2.update_yaxes(title_text="Effect Captured (%)", secondary_y=True)
-        fig2.update_layout(title="Same Campaign, Different ROI", height=400)
-        
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(_fig_attribution_roi(), use_container_width=True)
         
         # Comparison table
-        comparison_df = pd.DataFrame({
-            'Window': ['2 weeks', '8 weeks', '13 weeks'],
-            'Revenue Attributed': ['$200K', '$450K', '$480K'],
-            'ROI': ['2.0x', '4.5x', '4.8x'],
-            'Decision': ['Stop campaign', 'Scale up', 'Optimize']
-        })
-        st.dataframe(comparison_df, use_container_width=True)
+        st.table(_WINDOW_COMPARISON_TABLE)
     
     with col2:
         st.subheader("🔬 Technical Solutions")
         
-        st.markdown("""
-        **1. Adstock Transformations:**
-        """)
+        st.markdown(_MD_TAB4_ADSTOCK)
         
         tab_geo, tab_weibull, tab_delayed = st.tabs(["Geometric", "Weibull", "Delayed"])
         
         with tab_geo:
-            st.markdown("""
-            **Geometric Adstock** (Most Common)
-            ```python
-            def geometric_adstock(x, theta):
-                x_adstocked = np.zeros_like(x)
-                x_adstocked[0] = x[0]
-                for i in range(1, len(x)):
-                    x_adstocked[i] = x[i] + theta * x_adstocked[i-1]
-                return x_adstocked
-            
-            # Theta (decay rate): 0-1
-            # Half-life = -ln(2) / ln(theta)
-            ```
-            
-            **Parameters:**
-            - TV: θ = 0.4-0.7
-            - Radio: θ = 0.3-0.6  
-            - Digital: θ = 0.0-0.3
-            - OOH: θ = 0.2-0.5
-            """)
+            st.markdown(_MD_TAB4_GEO)
         
         with tab_weibull:
-            st.markdown("""
-            **Weibull Adstock** (Flexible Shape)
-            ```python
-            def weibull_adstock(x, shape, scale):
-                n = len(x)
-                convolve_window = np.arange(n)
-                convolve_window = (shape/scale) * (convolve_window/scale)**(shape-1) * 
-                                 np.exp(-(convolve_window/scale)**shape)
-                convolve_window = convolve_window / convolve_window.sum()
-                return np.convolve(x, convolve_window)[:n]
-            
-            # Shape < 1: L-shaped decay
-            # Shape > 1: Peak then decay
-            ```
-            """)
+            st.markdown(_MD_TAB4_WEIBULL)
         
         with tab_delayed:
-            st.markdown("""
-            **Delayed Adstock** (Peak Delay)
-            ```python
-            def delayed_adstock(x, theta, delay):
-                x_delayed = np.zeros_like(x)
-                x_delayed[delay:] = x[:-delay]
-                return geometric_adstock(x_delayed, theta)
-            
-            # Delay: 1-3 weeks typical
-            # Good for: TV, OOH
-            ```
-            """)
-        
-        st.markdown("""
-        **2. Selection Methods:**
-        
-        | Method | Description | Pros | Cons |
-        |--------|-------------|------|------|
-        | Grid Search | Test multiple θ values | Simple | Computationally expensive |
-        | AIC/BIC | Information criteria | Balances fit & complexity | May overfit |
-        | Cross-validation | Out-of-sample testing | Robust | Requires lots of data |
-        | Business knowledge | Use campaign duration | Practical | May be biased |
-        | Experiments | Measure actual decay | Ground truth | Expensive |
-        """)
+            st.markdown(_MD_TAB4_DELAYED)
+        
+        st.markdown(_MD_TAB4_SELECTION)
         
         st.success("""
         **🎯 Best Practice:**
@@ -600,57 +1232,12 @@ with tab5:
     with col1:
         st.subheader("📈 The Problem: Wrong Curve Shape")
         
-        # Generate different saturation curves
-        spend = np.linspace(0, 3000, 100)
-        
-        # Hill transformation (S-curve)
-        def hill_transform(x, alpha, gamma):
-            return alpha * (x**gamma) / (1 + x**gamma)
-        
-        # Adbudg transformation
-        def adbudg_transform(x, alpha, gamma):
-            return alpha * (1 - np.exp(-gamma * x))
-        
-        # Wrong curve (too early saturation)
-        wrong_curve = hill_transform(spend/500, 100, 0.8)
-        
-        # Correct curve
-        correct_curve = hill_transform(spend/2000, 100, 1.5)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=spend, y=wrong_curve, 
-                                name='Wrong Model (Saturates at $500K)',
-                                line=dict(color='red', width=3, dash='dash')))
-        fig.add_trace(go.Scatter(x=spend, y=correct_curve, 
-                                name='Reality (Saturates at $2M)',
-                                line=dict(color='green', width=3)))
-        
-        # Add current spend marker
-        fig.add_trace(go.Scatter(x=[500], y=[65], 
-                                mode='markers',
-                                name='Current Spend',
-                                marker=dict(size=15, color='blue', symbol='star')))
-        
-        fig.update_layout(
-            title="Saturation Misspecification: Missing Growth Opportunity",
-            xaxis_title="Monthly Spend ($K)",
-            yaxis_title="Response (%)",
-            height=400,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_saturation(), use_container_width=True)
         
         # ROI at different spend levels
         st.markdown("### 💰 Business Impact")
         
-        impact_df = pd.DataFrame({
-            'Spend Level': ['$500K', '$1M', '$2M'],
-            'Wrong Model ROI': ['1.3x', '1.1x', '1.0x'],
-            'Correct Model ROI': ['2.5x', '2.2x', '1.8x'],
-            'Decision (Wrong)': ['Stop here', 'Cut budget', 'Way too much'],
-            'Decision (Correct)': ['Keep going', 'Optimal', 'Near max']
-        })
-        st.dataframe(impact_df, use_container_width=True)
+        st.table(_IMPACT_TABLE)
         
         st.error("""
         **Cost of Wrong Saturation:**
@@ -665,91 +1252,15 @@ with tab5:
         tab_hill, tab_adbudg, tab_michaelis = st.tabs(["Hill", "Adbudg", "Michaelis-Menten"])
         
         with tab_hill:
-            st.markdown("""
-            **Hill Saturation (S-Curve)**
-            ```python
-            def hill_saturation(x, alpha, gamma):
-                # alpha: maximum effect
-                # gamma: shape parameter
-                return alpha * (x**gamma) / (1 + x**gamma)
-            
-            # gamma < 1: Concave (diminishing returns)
-            # gamma = 1: Michaelis-Menten
-            # gamma > 1: S-shaped (slow start)
-            ```
-            
-            **When to use:**
-            - TV, Radio, OOH (brand building)
-            - Channels with threshold effects
-            - Long purchase cycles
-            """)
+            st.markdown(_MD_TAB5_HILL)
         
         with tab_adbudg:
-            st.markdown("""
-            **Adbudg Saturation**
-            ```python
-            def adbudg_saturation(x, alpha, gamma):
-                # alpha: maximum effect
-                # gamma: rate of saturation
-                return alpha * (1 - np.exp(-gamma * x))
-            
-            # Higher gamma = faster saturation
-            ```
-            
-            **When to use:**
-            - Digital channels
-            - Direct response
-            - Quick saturation expected
-            """)
+            st.markdown(_MD_TAB5_ADBUDG)
         
         with tab_michaelis:
-            st.markdown("""
-            **Michaelis-Menten**
-            ```python
-            def michaelis_menten(x, vmax, km):
-                # vmax: maximum response
-                # km: half-saturation constant
-                return (vmax * x) / (km + x)
-            
-            # km = spend at 50% of max effect
-            ```
-            
-            **When to use:**
-            - Simple, interpretable
-            - One parameter for saturation point
-            - Good default choice
-            """)
-        
-        st.markdown("""
-        **3. Model Selection Framework:**
-        
-        ```python
-        from scipy.optimize import curve_fit
-        import numpy as np
-        
-        # Test multiple saturations
-        saturations = {
-            'linear': lambda x, a: a * x,
-            'sqrt': lambda x, a: a * np.sqrt(x),
-            'log': lambda x, a: a * np.log1p(x),
-            'hill': lambda x, a, g: hill_saturation(x, a, g),
-            'adbudg': lambda x, a, g: adbudg_saturation(x, a, g)
-        }
-        
-        # Fit each and compare AIC
-        best_aic = np.inf
-        best_model = None
-        
-        for name, func in saturations.items():
-            params, _ = curve_fit(func, X, y)
-            predictions = func(X, *params)
-            aic = calculate_aic(y, predictions, len(params))
-            
-            if aic < best_aic:
-                best_aic = aic
-                best_model = name
-        ```
-        """)
+            st.markdown(_MD_TAB5_MICHAELIS)
+        
+        st.markdown(_MD_TAB5_SELECTION)
         
         st.info("""
         **📊 Validation Checklist:**
@@ -770,148 +1281,30 @@ with tab6:
     with col1:
         st.subheader("📊 The Problem: Changing Baseline")
         
-        # Generate data with baseline drift
-        np.random.seed(42)
-        weeks = pd.date_range('2023-01-01', periods=52, freq='W')
-        
-        # Components
-        baseline_start = 100
-        baseline_trend = np.linspace(100, 120, 52)  # 20% growth
-        marketing_spend = np.ones(52) * 100  # Flat spend
-        marketing_effect = marketing_spend * 0.5 + np.random.normal(0, 5, 52)
-        total_sales = baseline_trend + marketing_effect
-        
-        # Create plot
-        fig = go.Figure()
-        
-        # Add traces
-        fig.add_trace(go.Scatter(x=weeks, y=total_sales, 
-                                name='Total Sales', 
-                                line=dict(color='black', width=3)))
-        fig.add_trace(go.Scatter(x=weeks, y=baseline_trend, 
-                                name='True Baseline (Hidden)', 
-                                line=dict(color='green', width=2, dash='dash')))
-        fig.add_trace(go.Scatter(x=weeks, y=marketing_spend, 
-                                name='Marketing Spend (Flat)', 
-                                line=dict(color='red', width=2),
-                                yaxis='y2'))
-        
-        fig.update_layout(
-            title="Sales Growing 20% While Marketing Flat - Who Gets Credit?",
-            xaxis_title="Date",
-            yaxis_title="Sales Index",
-            yaxis2=dict(
-                title="Marketing Spend Index",
-                overlaying='y',
-                side='right'
-            ),
-            height=400,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_baseline_drift(), use_container_width=True)
         
         # Model comparison
         st.markdown("### 🔍 Model Comparison")
         
-        model_comparison = pd.DataFrame({
-            'Model': ['Without Trend', 'With Linear Trend', 'With Spline Trend'],
-            'Marketing ROI': ['5.2x (inflated)', '2.5x (correct)', '2.4x (correct)'],
-            'R²': [0.45, 0.89, 0.92],
-            'MAPE': ['18.5%', '4.2%', '3.8%'],
-            'Baseline Growth': ['Not captured', '1.5% monthly', 'Variable']
-        })
-        st.dataframe(model_comparison, use_container_width=True)
+        st.table(_MODEL_COMPARISON_TABLE)
     
     with col2:
         st.subheader("🔬 Detection & Solutions")
         
-        st.markdown("""
-        **1. Statistical Tests for Drift:**
-        """)
+        st.markdown(_MD_TAB6_TESTS)
         
         tab_chow, tab_cusum, tab_kalman = st.tabs(["Chow Test", "CUSUM", "Kalman Filter"])
         
         with tab_chow:
-            st.markdown("""
-            **Chow Test for Structural Break**
-            ```python
-            from statsmodels.stats.diagnostic import breaks_cusumolsresid
-            
-            def chow_test(y, X, break_point):
-                n = len(y)
-                X1, y1 = X[:break_point], y[:break_point]
-                X2, y2 = X[break_point:], y[break_point:]
-                
-                # Fit separate models
-                RSS_pooled = OLS(y, X).fit().ssr
-                RSS_1 = OLS(y1, X1).fit().ssr
-                RSS_2 = OLS(y2, X2).fit().ssr
-                
-                # F-statistic
-                k = X.shape[1]
-                F = ((RSS_pooled - (RSS_1 + RSS_2)) / k) / 
-                    ((RSS_1 + RSS_2) / (n - 2*k))
-                
-                p_value = 1 - stats.f.cdf(F, k, n-2*k)
-                return F, p_value
-            ```
-            """)
+            st.markdown(_MD_TAB6_CHOW)
         
         with tab_cusum:
-            st.markdown("""
-            **CUSUM Test**
-            ```python
-            def cusum_test(residuals):
-                cusum = np.cumsum(residuals) / np.std(residuals)
-                
-                # Critical bounds (5% significance)
-                n = len(residuals)
-                bounds = 0.948 * np.sqrt(n) * np.array([1, -1])
-                
-                # Check if CUSUM exceeds bounds
-                drift_detected = np.any(np.abs(cusum) > bounds[0])
-                return cusum, bounds, drift_detected
-            ```
-            
-            **Interpretation:**
-            - Within bounds: No drift
-            - Exceeds bounds: Parameter instability
-            """)
+            st.markdown(_MD_TAB6_CUSUM)
         
         with tab_kalman:
-            st.markdown("""
-            **Kalman Filter (Time-Varying Parameters)**
-            ```python
-            from pykalman import KalmanFilter
-            
-            # State space model
-            kf = KalmanFilter(
-                transition_matrices=[[1, 1], [0, 1]],
-                observation_matrices=[[1, 0]],
-                initial_state_mean=[sales[0], 0],
-                initial_state_covariance=np.eye(2),
-                transition_covariance=0.01*np.eye(2),
-                observation_covariance=1
-            )
-            
-            # Estimate time-varying baseline
-            state_means, _ = kf.filter(sales)
-            baseline = state_means[:, 0]
-            trend = state_means[:, 1]
-            ```
-            """)
-        
-        st.markdown("""
-        **2. Trend Specifications:**
-        
-        | Type | Formula | Use Case |
-        |------|---------|----------|
-        | Linear | β₀ + β₁t | Steady growth |
-        | Quadratic | β₀ + β₁t + β₂t² | Acceleration |
-        | Log | β₀ + β₁ln(t) | Slowing growth |
-        | Spline | Σβᵢ·basis_i(t) | Flexible |
-        | Prophet | g(t) + s(t) + h(t) | Complex patterns |
-        """)
+            st.markdown(_MD_TAB6_KALMAN)
+        
+        st.markdown(_MD_TAB6_TRENDS)
         
         st.success("""
         **🎯 Implementation Steps:**
@@ -922,20 +1315,9 @@ with tab6:
         5. Compare models with/without trend (AIC)
         6. Validate on holdout period
         """)
+        
+        st.markdown(_MD_TAB6_PIPELINE)
 
 # Add footer
 st.markdown("---")
-st.markdown("""
-### 📚 Key Takeaways
-
-| Pitfall | Detection | Primary Solution | Validation |
-|---------|-----------|-----------------|------------|
-| Data Quality | Compare sources | Use platform data | Correlation > 0.95 |
-| External Factors | RESET test | Include confounders | Check residuals |
-| Multicollinearity | VIF > 10 | Ridge regression | Cross-validation |
-| Attribution Windows | Compare windows | Grid search decay | Business knowledge |
-| Saturation | Compare curves | Test multiple forms | Competitor benchmarks |
-| Baseline Drift | CUSUM test | Add trend terms | Holdout test |
-
-**Remember:** These pitfalls often occur together. Always check for all six in your MMM projects!
-""")
\ No newline at end of file
+st.markdown(_MD_TAKEAWAYS)
\ No newline at end of file